@@ -1,6 +1,15 @@
 from . import types
 from . import errors
-from ._data_loader import EventsFileReader, line_to_event, line_to_monthly_event
+from ._file_cache import ParsedFileCache
+from ._data_loader import (
+    EventsFileReader,
+    line_to_event,
+    line_to_monthly_event,
+    line_to_event_in_cents,
+    line_to_monthly_event_in_cents,
+)
+from ._money import to_cents, format_cents
+from ._columnar_loader import EventColumns, MonthlyEventColumns, read_event_columns, read_monthly_event_columns
 from .types import (
     EventData,
     MonthlyEventData,
@@ -11,8 +20,22 @@ from .types import (
     Event,
 )
 from ._event_generator import EventGenerator
-from ._compare_history import HistoryComparator
-from ._balance_calculator import BalanceLogCalulator, ReportDay
-from ._validation import validate_event_data, validate_monthly_event_data
-from ._main import show_balance, MainCfg, build_data_sources_configuration, read_initial_balance
+from ._recurrence import get_occurrence_range, get_occurrence_dates, get_occurrence_array
+from ._compare_history import HistoryComparator, MultiHistoryComparator, StreamingHistoryComparator
+from ._balance_calculator import BalanceLogCalulator, ReportDay, ReportDaySampler
+from ._balance_series import BalanceSeries
+from ._event_table import EventTable
+from ._balance_index import BalanceIndex
+from ._balance_range import BalanceRangeIndex
+from ._incremental_calculator import IncrementalBalanceCalculator
+from ._vectorized_calculator import VectorizedBalanceLogCalculator
+from ._monte_carlo import MonteCarloForecast, Perturbation, ForecastBands
+from ._what_if import WhatIfSweep
+from ._validation import (
+    validate_event_data,
+    validate_monthly_event_data,
+    validate_event_columns,
+    validate_monthly_event_columns,
+)
+from ._main import show_balance, get_balance_logs, MainCfg, build_data_sources_configuration, read_initial_balance
 from .errors import BalanceException
@@ -1,12 +1,13 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import List, Iterable, Sequence
 import dataclasses
 import datetime
-import calendar
+
+import numpy as np
 
 from .types import Event, Balance
 from .errors import CalculatorError
-from ._helpers import increase_date_by_one_month
+from ._balance_series import balance_log_to_arrays
 
 
 @dataclasses.dataclass
@@ -15,20 +16,15 @@ class ReportDay:
     description: str
 
 
-class BalanceLogCalulator:
-    @dataclasses.dataclass
-    class __ReportData:
-        description: str
-        balance: Optional[Balance] = None
-        date: Optional[datetime.date] = None
+class ReportDaySampler:
+    """Samples a date-sorted balance log on report days with binary search over a date index built once."""
 
-    def __init__(self, events: List[Event]) -> None:
-        self.__events = events
-        self.__balance_log: List[Balance] = []
-        self.__calendar = calendar.Calendar()
+    def __init__(self, balance_log: Sequence[Balance]) -> None:
+        self.__dates, values = balance_log_to_arrays(balance_log)
+        self.__values = values.tolist()
 
-    def get_balance_at_report_day(self, *report_days: ReportDay) -> List[Balance]:
-        if not self.__balance_log:
+    def sample(self, *report_days: ReportDay) -> List[Balance]:
+        if len(self.__values) == 0:
             raise CalculatorError("Balance log not calulated. Run 'get_balance_log' first")
         if len(report_days) < 1:
             raise CalculatorError("No report days provided")
@@ -36,52 +32,30 @@ class BalanceLogCalulator:
             self.__validate_report_day(day)
         result = list()
         for day in report_days:
-            result += self.__get_balance_at_report_day(day)
+            result += self.__sample_report_day(day)
         result.sort(key=lambda b: b.date)
         return result
 
-    def __get_balance_at_report_day(self, report_day: ReportDay) -> List[Balance]:
-        result = list()
-        next_report = self.__ReportData(description=report_day.description)
-        for balance in self.__balance_log:
-            if next_report.date is None:
-                next_report = self.__cretate_report_data(balance, report_day)
-            elif balance.date <= next_report.date:
-                next_report.balance = balance
-            else:
-                result.append(self.__create_report_balance(next_report))
-                next_report = self.__cretate_report_data(balance, report_day)
-                result += self.__duplicate_report_balance(result[-1], next_report.date)
-        if next_report.balance is not None:
-            result.append(self.__create_report_balance(next_report))
-        return result
-
-    def __cretate_report_data(self, balance: Balance, report_day: ReportDay) -> __ReportData:
-        return self.__ReportData(
-            description=report_day.description,
-            balance=balance,
-            date=self.__get_report_date(balance.date, report_day.month_day)
-        )
-
-    def __create_report_balance(self, report_state: __ReportData) -> Balance:
-        return dataclasses.replace(report_state.balance, date=report_state.date, description=report_state.description)
-
-    def __duplicate_report_balance(self, balance: Balance, next_change_date: datetime.date) -> List[Balance]:
-        result = []
-        time_delta = next_change_date - balance.date
-        while time_delta.days > 31:
-            balance = dataclasses.replace(balance, date=increase_date_by_one_month(balance.date))
-            result.append(balance)
-            time_delta = next_change_date - balance.date
-        return result
+    def __sample_report_day(self, report_day: ReportDay) -> List[Balance]:
+        report_dates = self.__get_report_dates(report_day.month_day)
+        indices = np.searchsorted(self.__dates, report_dates, side="right") - 1
+        return [
+            Balance(description=report_day.description, date=date, value=self.__values[idx])
+            for date, idx in zip(report_dates.tolist(), indices.tolist())
+        ]
 
-    def __get_report_date(self, date: datetime.date, report_day: int) -> datetime.date:
-        if report_day == -1:
-            report_day = max(self.__calendar.itermonthdays(date.year, date.month))
-        result = date.replace(day=report_day)
-        if result < date:
-            return increase_date_by_one_month(result)
-        return result
+    def __get_report_dates(self, month_day: int) -> np.ndarray:
+        first_date, last_date = self.__dates[0], self.__dates[-1]
+        first_month = first_date.astype("datetime64[M]")
+        last_month = last_date.astype("datetime64[M]")
+        if month_day == -1:
+            months = np.arange(first_month, last_month + 1)
+            return (months + 1).astype("datetime64[D]") - 1
+        # Report date is the first day with the given month day on or after the balance date
+        first_month += int(_get_day(first_date) > month_day)
+        last_month += int(_get_day(last_date) > month_day)
+        months = np.arange(first_month, last_month + 1)
+        return months.astype("datetime64[D]") + (month_day - 1)
 
     def __validate_report_day(self, report_day: ReportDay) -> None:
         if report_day.month_day > 28 or report_day.month_day < -1 or report_day.month_day == 0:
@@ -89,22 +63,46 @@ class BalanceLogCalulator:
                 f"Month end day={report_day.month_day} is not alowed. Try numbers from[1, ..., 28] or -1."
             )
 
+
+class BalanceLogCalulator:
+    @dataclasses.dataclass
+    class __DayBalance:
+        date: datetime.date
+        value: float
+        descriptions: List[str]
+
+    def __init__(self, events: Iterable[Event], with_descriptions: bool = True) -> None:
+        self.__events = events
+        self.__with_descriptions = with_descriptions
+        self.__balance_log: List[Balance] = []
+
+    def get_balance_at_report_day(self, *report_days: ReportDay) -> List[Balance]:
+        return ReportDaySampler(self.__balance_log).sample(*report_days)
+
     def get_balance_log(self, initial: Balance) -> List[Balance]:
-        self.__balance_log = [initial]
+        self.__balance_log = []
+        # Descriptions of same-day events are collected and joined once, when the day is closed
+        day = self.__DayBalance(date=initial.date, value=initial.value, descriptions=[initial.description])
         for event in self.__events:
-            self.__process_event(event)
+            day = self.__process_event(day, event)
+        self.__balance_log.append(self.__create_balance(day))
         return self.__balance_log
 
-    def __process_event(self, event: Event) -> None:
-        previous_balance = self.__balance_log[-1]
-        if event.date < previous_balance.date:
-            return
-        value = previous_balance.value + event.balance_impact
-        if event.date == previous_balance.date:
-            self.__balance_log[-1] = Balance(
-                description=previous_balance.description + ", " + event.description,
-                date=event.date,
-                value=value
-            )
-            return
-        self.__balance_log.append(Balance(description=event.description, date=event.date, value=value))
+    def __process_event(self, day: __DayBalance, event: Event) -> __DayBalance:
+        if event.date < day.date:
+            return day
+        if event.date > day.date:
+            self.__balance_log.append(self.__create_balance(day))
+            day = self.__DayBalance(date=event.date, value=day.value, descriptions=[])
+        day.value += event.balance_impact
+        if self.__with_descriptions:
+            day.descriptions.append(event.description)
+        return day
+
+    def __create_balance(self, day: __DayBalance) -> Balance:
+        description = ", ".join(day.descriptions) if self.__with_descriptions else ""
+        return Balance(description=description, date=day.date, value=day.value)
+
+
+def _get_day(date: np.datetime64) -> int:
+    return int((date - date.astype("datetime64[M]")).astype(int)) + 1
@@ -0,0 +1,30 @@
+from typing import Iterable, Sequence, Union
+import datetime
+
+import numpy as np
+
+from .types import Balance
+from .errors import CalculatorError
+from ._balance_series import balance_log_to_arrays
+
+
+class BalanceIndex:
+    """Point-in-time balance queries over a balance log, answered with binary search."""
+
+    def __init__(self, balance_log: Sequence[Balance]) -> None:
+        self.__dates, self.__values = balance_log_to_arrays(balance_log)
+        if len(self.__dates) == 0:
+            raise CalculatorError("Balance log is empty")
+        if np.any(self.__dates[1:] < self.__dates[:-1]):
+            raise CalculatorError("Balance log dates are not sorted")
+
+    def balance_at(self, date: datetime.date) -> float:
+        return self.balances_at([date])[0].item()
+
+    def balances_at(self, dates: Union[Iterable[datetime.date], np.ndarray]) -> np.ndarray:
+        """Return balance at the end of each day; dates before the log start raise CalculatorError."""
+        dates = np.asarray(dates if isinstance(dates, np.ndarray) else list(dates), dtype="datetime64[D]")
+        indices = np.searchsorted(self.__dates, dates, side="right") - 1
+        if np.any(indices < 0):
+            raise CalculatorError(f"Balance log starts at {self.__dates[0]}")
+        return self.__values[indices]
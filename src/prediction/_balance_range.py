@@ -0,0 +1,94 @@
+from typing import Callable, List, Optional, Sequence, Tuple
+import datetime
+
+import numpy as np
+
+from .types import Balance
+from .errors import CalculatorError
+from ._balance_series import balance_log_to_arrays
+
+
+class _SparseTable:
+    """Idempotent range reduction (min or max) in O(1) per query after O(n log n) build."""
+
+    def __init__(self, values: np.ndarray, reduce: np.ufunc) -> None:
+        self.__reduce = reduce
+        self.__levels: List[np.ndarray] = [values]
+        width = 1
+        while 2 * width <= len(values):
+            previous = self.__levels[-1]
+            self.__levels.append(reduce(previous[:-width], previous[width:]))
+            width *= 2
+
+    def query(self, first: int, last: int) -> float:
+        """Reduce values at positions [first, last]."""
+        level = (last - first + 1).bit_length() - 1
+        table = self.__levels[level]
+        return self.__reduce(table[first], table[last - (1 << level) + 1])
+
+
+class BalanceRangeIndex:
+    """Minimum, maximum and threshold-crossing queries over a balance log.
+
+    A balance holds from its date until the next balance, so a date range covers the balance
+    in effect at its start plus every balance dated inside it.
+    """
+
+    def __init__(self, balance_log: Sequence[Balance]) -> None:
+        self.__dates, self.__values = balance_log_to_arrays(balance_log)
+        if len(self.__dates) == 0:
+            raise CalculatorError("Balance log is empty")
+        if np.any(self.__dates[1:] < self.__dates[:-1]):
+            raise CalculatorError("Balance log dates are not sorted")
+        self.__min = _SparseTable(self.__values, np.minimum)
+        self.__max = _SparseTable(self.__values, np.maximum)
+
+    def min_balance(self, start: Optional[datetime.date] = None, end: Optional[datetime.date] = None) -> float:
+        first, last = self.__get_range(start, end)
+        return self.__min.query(first, last).item()
+
+    def max_balance(self, start: Optional[datetime.date] = None, end: Optional[datetime.date] = None) -> float:
+        first, last = self.__get_range(start, end)
+        return self.__max.query(first, last).item()
+
+    def argmin(self, start: Optional[datetime.date] = None, end: Optional[datetime.date] = None) -> datetime.date:
+        """First date within the range on which the minimum balance is reached."""
+        first, last = self.__get_range(start, end)
+        minimum = self.__min.query(first, last)
+        idx = self.__find_first(first, last, lambda value: value <= minimum)
+        return self.__get_date(idx, start)
+
+    def first_below(self, threshold: float, start: Optional[datetime.date] = None) -> Optional[datetime.date]:
+        """First date on or after start with balance below threshold, None if it never drops below."""
+        first, last = self.__get_range(start, None)
+        if self.__min.query(first, last) >= threshold:
+            return None
+        idx = self.__find_first(first, last, lambda value: value < threshold)
+        return self.__get_date(idx, start)
+
+    def __find_first(self, first: int, last: int, predicate: Callable[[float], bool]) -> int:
+        # Smallest idx such that predicate holds for min over [first, idx]; the min only decreases with idx
+        low, high = first, last
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(self.__min.query(first, middle)):
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def __get_range(self, start: Optional[datetime.date], end: Optional[datetime.date]) -> Tuple[int, int]:
+        first = 0 if start is None else max(0, self.__index_at(start))
+        last = len(self.__values) - 1 if end is None else self.__index_at(end)
+        if last < 0 or (start is not None and end is not None and end < start):
+            raise CalculatorError(f"Date range [{start}, {end}] does not overlap balance log")
+        return first, last
+
+    def __index_at(self, date: datetime.date) -> int:
+        return int(np.searchsorted(self.__dates, np.datetime64(date, "D"), side="right")) - 1
+
+    def __get_date(self, idx: int, start: Optional[datetime.date]) -> datetime.date:
+        date = self.__dates[idx].item()
+        if start is not None and date < start:
+            return start
+        return date
@@ -0,0 +1,73 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from typing import List, Optional, Union, Tuple
+
+import numpy as np
+
+from .types import Balance
+
+
+_DESCRIPTION_SEP = ", "
+
+
+class BalanceSeries(Sequence):
+    """Balance log kept as arrays; Balance objects are created only when items are accessed.
+
+    Description of balance i is made of description_parts[description_offsets[i]:description_offsets[i + 1]].
+    """
+
+    def __init__(
+        self,
+        dates: np.ndarray,
+        values: np.ndarray,
+        description_parts: Optional[np.ndarray] = None,
+        description_offsets: Optional[np.ndarray] = None,
+    ) -> None:
+        self.__dates = dates
+        self.__values = values
+        self.__description_parts = description_parts
+        self.__description_offsets = description_offsets
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.__dates
+
+    @property
+    def values(self) -> np.ndarray:
+        return self.__values
+
+    def __len__(self) -> int:
+        return len(self.__dates)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Balance, List[Balance]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("BalanceSeries index out of range")
+        return Balance(
+            description=self.description(idx), date=self.__dates[idx].item(), value=self.__values[idx].item()
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (BalanceSeries, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def description(self, idx: int) -> str:
+        if self.__description_parts is None:
+            return ""
+        start, end = self.__description_offsets[idx], self.__description_offsets[idx + 1]
+        return _DESCRIPTION_SEP.join(self.__description_parts[start:end])
+
+    def to_balances(self) -> List[Balance]:
+        return list(self)
+
+
+def balance_log_to_arrays(balance_log: Sequence, unit: str = "D") -> Tuple[np.ndarray, np.ndarray]:
+    if isinstance(balance_log, BalanceSeries):
+        return balance_log.dates.astype(f"datetime64[{unit}]", copy=False), balance_log.values
+    dates = np.array([b.date for b in balance_log], dtype=f"datetime64[{unit}]")
+    values = np.array([b.value for b in balance_log])
+    return dates, values
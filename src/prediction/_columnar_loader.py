@@ -0,0 +1,132 @@
+from __future__ import annotations
+from typing import Iterator, List, Tuple
+import dataclasses
+import os
+
+import numpy as np
+
+from .types import EventData, MonthlyEventData
+from ._data_loader import _SEP, _DATE_SEP
+from ._money import to_cents_array
+
+
+@dataclasses.dataclass(frozen=True)
+class EventColumns:
+    description: np.ndarray
+    value: np.ndarray
+    date: np.ndarray
+    paid: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.description)
+
+    def row(self, idx: int) -> EventData:
+        return EventData(
+            description=str(self.description[idx]),
+            value=self.value[idx].item(),
+            date=self.date[idx].item(),
+            paid=bool(self.paid[idx]),
+        )
+
+    def __iter__(self) -> Iterator[EventData]:
+        for idx in range(len(self)):
+            yield self.row(idx)
+
+
+@dataclasses.dataclass(frozen=True)
+class MonthlyEventColumns:
+    description: np.ndarray
+    value: np.ndarray
+    start_date: np.ndarray
+    end_date: np.ndarray
+    month_day: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.description)
+
+    def row(self, idx: int) -> MonthlyEventData:
+        end_date = self.end_date[idx]
+        return MonthlyEventData(
+            description=str(self.description[idx]),
+            value=self.value[idx].item(),
+            start_date=self.start_date[idx].item(),
+            end_date=None if np.isnat(end_date) else end_date.item(),
+            month_day=int(self.month_day[idx]),
+        )
+
+    def __iter__(self) -> Iterator[MonthlyEventData]:
+        for idx in range(len(self)):
+            yield self.row(idx)
+
+
+def read_event_columns(path: str, cents: bool = False) -> EventColumns:
+    description, value, date, paid = _read_raw_columns(path, n_columns=4)
+    return EventColumns(
+        description=np.char.strip(description),
+        value=_to_values(value, cents),
+        date=_to_dates(date),
+        paid=np.char.str_len(paid) > 0,
+    )
+
+
+def read_monthly_event_columns(path: str, cents: bool = False) -> MonthlyEventColumns:
+    description, value, start_date, end_date = _read_raw_columns(path, n_columns=4)
+    start_dates = _to_dates(start_date)
+    return MonthlyEventColumns(
+        description=np.char.strip(description),
+        value=_to_values(value, cents),
+        start_date=start_dates,
+        end_date=_to_dates(end_date, required=False),
+        month_day=_day_of_month(start_dates),
+    )
+
+
+def _read_raw_columns(path: str, n_columns: int) -> List[np.ndarray]:
+    with open(os.path.realpath(path)) as file:
+        next(file, None)
+        lines = np.array(file.read().splitlines(), dtype=str)
+    lines = np.char.strip(lines)
+    rest = lines[np.char.str_len(lines) > 0]
+    columns = []
+    for _ in range(n_columns):
+        column, _, rest = _partition(rest, _SEP)
+        columns.append(column)
+    return columns
+
+
+def _to_values(column: np.ndarray, cents: bool) -> np.ndarray:
+    if cents:
+        return to_cents_array(column)
+    return np.char.strip(column).astype(np.float64)
+
+
+def _to_dates(column: np.ndarray, required: bool = True) -> np.ndarray:
+    if column.size == 0:
+        return np.array([], dtype="datetime64[D]")
+    column = np.char.strip(column)
+    lengths = np.char.str_len(column)
+    missing = lengths == 0
+    if required and np.any(missing):
+        raise ValueError("Missing date in required column")
+    if np.all(missing | (lengths == len("YYYY.MM.DD"))):
+        return np.char.replace(column, _DATE_SEP, "-").astype("datetime64[D]")
+    year, _, rest = _partition(np.where(missing, "1970.1.1", column), _DATE_SEP)
+    month, _, day = _partition(rest, _DATE_SEP)
+    year, month, day = year.astype(np.int64), month.astype(np.int64), day.astype(np.int64)
+    months = (year - 1970) * 12 + month - 1
+    dates = months.astype("datetime64[M]").astype("datetime64[D]") + (day - 1)
+    if np.any((month < 1) | (month > 12) | (day < 1) | (_day_of_month(dates) != day)):
+        raise ValueError("Invalid date in column")
+    dates[missing] = np.datetime64("NaT")
+    return dates
+
+
+def _partition(column: np.ndarray, sep: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if column.size == 0:
+        return column, column, column
+    parts = np.char.partition(column, sep)
+    return parts[..., 0], parts[..., 1], parts[..., 2]
+
+
+def _day_of_month(dates: np.ndarray) -> np.ndarray:
+    return (dates - dates.astype("datetime64[M]")).astype(np.int64) + 1
@@ -1,9 +1,14 @@
 from __future__ import annotations
-import dataclasses as ds
-from itertools import chain
-from typing import List
-from datetime import date
-from .types import BalanceHistory, Comparition, Difference, Balance, Event
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+import datetime
+import itertools
+
+import numpy as np
+
+from .types import BalanceHistory, Comparition, Difference, Balance, HistoryId, RunLengthComparition, DifferenceRun
+from .errors import ValidationError
+from ._balance_series import BalanceSeries, balance_log_to_arrays
+from ._helpers import to_naive_utc
 
 
 class ComparatorException(Exception):
@@ -15,75 +20,183 @@ class BaseIsEmpty(ComparatorException):
 
 
 class HistoryComparator:
+    """Compares balances of two histories on every date either of them has a balance.
+
+    Dates before the later of the two first balances are skipped; on other dates each history
+    contributes its latest balance not after that date.
+    """
+
     def __init__(self, base: BalanceHistory, compared: BalanceHistory) -> None:
         self.__base = base
         self.__compared = compared
-        self.__aligned_base: List[Event] = None
-        self.__aligned_compared: List[Event] = None
-        self.__common_dates: List[date] = []
-        self.__first_date: date = None
-
-    def compare(self) -> Comparition:
-        try:
-            self.__first_date = max(self.__base.balances[0].date, self.__compared.balances[0].date)
-        except IndexError:
-            return Comparition(diffs=[], base_id=self.__base.id, compared_id=self.__compared.id)
-        self.__fill_common_dates()
-        self.__aligned_base = self.__align(self.__base.balances)
-        self.__aligned_compared = self.__align(self.__compared.balances)
-        differences = []
-        for base, compared in zip(self.__aligned_base, self.__aligned_compared):
-            if base.date < self.__first_date:
+
+    def compare(self, run_length: bool = False) -> Union[Comparition, RunLengthComparition]:
+        return MultiHistoryComparator(self.__base, [self.__compared]).compare(run_length)[0]
+
+
+class MultiHistoryComparator:
+    """Compares one base history with many others, aligning every history once on a union date axis.
+
+    compare returns the same Comparition as HistoryComparator would for each compared history.
+    """
+
+    def __init__(self, base: BalanceHistory, compared: Sequence[BalanceHistory]) -> None:
+        self.__base = base
+        self.__compared = list(compared)
+
+    def compare(self, run_length: bool = False) -> Union[List[Comparition], List[RunLengthComparition]]:
+        """Return one comparition per compared history; with run_length only change points are kept."""
+        dates, original_dates, base, compared = self.__align()
+        comparitions = []
+        for history, aligned in zip(self.__compared, compared):
+            if base.is_empty or aligned.is_empty:
+                common = np.zeros(len(dates), dtype=bool)
+                values = np.array([])
+            else:
+                first = max(base.first, aligned.first)
+                common = (base.own_dates | aligned.own_dates) & (np.arange(len(dates)) >= first)
+                values = aligned.values[common] - base.values[common]
+            if run_length:
+                comparitions.append(
+                    _to_run_length_comparition(self.__base.id, history.id, original_dates[common], values)
+                )
+            else:
+                diffs = [Difference(date=d, value=v) for d, v in zip(original_dates[common].tolist(), values.tolist())]
+                comparitions.append(Comparition(diffs=diffs, base_id=self.__base.id, compared_id=history.id))
+        return comparitions
+
+    def diff_matrix(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the union date axis and a (dates x compared histories) matrix of differences.
+
+        Differences are forward filled between balance dates; NaN marks dates before either
+        history starts.
+        """
+        dates, _, base, compared = self.__align()
+        matrix = np.full((len(dates), len(compared)), np.nan)
+        for column, aligned in enumerate(compared):
+            if base.is_empty or aligned.is_empty:
                 continue
-            assert base.date == compared.date, f"{base}, {compared}"
-            diff = Difference(date=base.date, value=compared.value - base.value)
-            differences.append(diff)
-        return Comparition(
-            diffs=differences, base_id=self.__base.id, compared_id=self.__compared.id
-        )
+            first = max(base.first, aligned.first)
+            matrix[first:, column] = aligned.values[first:] - base.values[first:]
+        return dates, matrix
+
+    def __align(self) -> Tuple[np.ndarray, np.ndarray, _AlignedHistory, List[_AlignedHistory]]:
+        """Return the union date axis, the Balance.date object of every axis date and the aligned histories.
+
+        The axis is only used for searching; results report the original date objects so aware
+        datetimes keep their time zone.
+        """
+        histories = [self.__base] + self.__compared
+        # Histories loaded from a repository hold datetimes; keep their time instead of truncating to days
+        has_time = any(isinstance(b.date, datetime.datetime) for h in histories for b in h.balances)
+        arrays = [_to_arrays(h.balances, unit="us" if has_time else "D") for h in histories]
+        dates, sources = _merge_dates([history_dates for history_dates, _, _ in arrays])
+        original_dates = np.concatenate([originals for _, originals, _ in arrays])[sources]
+        aligned = [_AlignedHistory(history_dates, values, dates) for history_dates, _, values in arrays]
+        return dates, original_dates, aligned[0], aligned[1:]
+
+
+class StreamingHistoryComparator:
+    """Yields the differences HistoryComparator would return, from two date-sorted Balance iterables.
+
+    Balances are consumed lazily and only the current and next balance of each input are kept.
+    """
 
-    def __fill_common_dates(self) -> None:
-        dates = chain((b.date for b in self.__base.balances), (c.date for c in self.__compared.balances))
-        dates_set = set(dates)
-        self.__common_dates = list(d for d in dates_set if d >= self.__first_date)
-        self.__common_dates.sort()
-
-    def __align(self, balances: List[Balance]) -> List[Balance]:
-        aligned = self.__align_first_balance(balances)
-        return self.__align_to_common_dates(aligned)
-
-    def __align_first_balance(self, balances: List[Balance]) -> List[Balance]:
-        n_skipped = 0
-        first_balance = None
-        for bal in balances:
-            if bal.date <= self.__first_date:
-                first_balance = ds.replace(bal, date=self.__first_date)
-                n_skipped += 1
-        if first_balance:
-            return [first_balance] + balances[n_skipped:]
-        return balances
-
-    def __align_to_common_dates(self, source: List[Balance]) -> List[Balance]:
-        aligned = []
-        balance_idx = 0
-        date_idx = 0
-        prev_bal = None
+    def __init__(self, base: Iterable[Balance], compared: Iterable[Balance]) -> None:
+        self.__base = base
+        self.__compared = compared
+
+    def compare(self) -> Iterator[Difference]:
+        base_balances = _last_balance_per_date(self.__base)
+        compared_balances = _last_balance_per_date(self.__compared)
+        base, compared = next(base_balances, None), next(compared_balances, None)
+        if base is None or compared is None:
+            return
+        base_next, compared_next = next(base_balances, None), next(compared_balances, None)
+        current = max(base.date, compared.date)
         while True:
-            try:
-                bal = source[balance_idx]
-            except IndexError:
-                bal = prev_bal
-            try:
-                current = self.__common_dates[date_idx]
-            except IndexError:
-                break
-            if bal.date == current:
-                aligned.append(bal)
-                prev_bal = bal
-                balance_idx += 1
-            if bal.date < current:
-                aligned.append(ds.replace(bal, date=current))
-            elif bal.date > current:
-                aligned.append(ds.replace(prev_bal, date=current))
-            date_idx += 1
-        return aligned
+            if base_next is not None and base_next.date <= current:
+                base, base_next = base_next, next(base_balances, None)
+            if compared_next is not None and compared_next.date <= current:
+                compared, compared_next = compared_next, next(compared_balances, None)
+            if _is_after(base_next, current) and _is_after(compared_next, current):
+                yield Difference(date=current, value=compared.value - base.value)
+                upcoming = [b.date for b in (base_next, compared_next) if b is not None]
+                if not upcoming:
+                    return
+                current = min(upcoming)
+
+
+def _is_after(balance: Optional[Balance], date: datetime.date) -> bool:
+    return balance is None or balance.date > date
+
+
+def _last_balance_per_date(balances: Iterable[Balance]) -> Iterator[Balance]:
+    previous = None
+    for _, same_date in itertools.groupby(balances, key=lambda b: b.date):
+        for balance in same_date:
+            pass
+        if previous is not None and balance.date < previous.date:
+            raise ValidationError("balances dates are descending")
+        previous = balance
+        yield balance
+
+
+def _to_run_length_comparition(
+    base_id: HistoryId, compared_id: HistoryId, dates: np.ndarray, values: np.ndarray
+) -> RunLengthComparition:
+    if len(values) == 0:
+        return RunLengthComparition(
+            base_id=base_id, compared_id=compared_id, runs=[], max_abs_diff=None, first_divergence_date=None
+        )
+    starts = np.flatnonzero(np.append(True, values[1:] != values[:-1]))
+    ends = np.append(starts[1:] - 1, len(values) - 1)
+    runs = [
+        DifferenceRun(start_date=start, end_date=end, value=value)
+        for start, end, value in zip(dates[starts].tolist(), dates[ends].tolist(), values[starts].tolist())
+    ]
+    divergent = np.flatnonzero(values != 0)
+    return RunLengthComparition(
+        base_id=base_id,
+        compared_id=compared_id,
+        runs=runs,
+        max_abs_diff=np.abs(values).max().item(),
+        first_divergence_date=dates[divergent[0]] if len(divergent) else None,
+    )
+
+
+class _AlignedHistory:
+    """History values forward filled onto a date axis; positions before first are not valid."""
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray, axis: np.ndarray) -> None:
+        self.is_empty = len(dates) == 0
+        if self.is_empty:
+            return
+        positions = np.searchsorted(dates, axis, side="right") - 1
+        self.first = int(np.searchsorted(axis, dates[0], side="left"))
+        self.values = values[np.maximum(positions, 0)]
+        self.own_dates = dates[positions] == axis
+
+
+def _to_arrays(balances: Sequence[Balance], unit: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return searchable dates, the original date objects and the values of a balance log."""
+    if isinstance(balances, BalanceSeries):
+        dates, values = balance_log_to_arrays(balances, unit)
+        return dates, balances.dates.astype(object), values
+    originals = np.array([b.date for b in balances], dtype=object)
+    dates = np.array([to_naive_utc(d) for d in originals], dtype=f"datetime64[{unit}]")
+    return dates, originals, np.array([b.value for b in balances])
+
+
+def _merge_dates(dates: Sequence[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return sorted unique dates of already sorted arrays and the index of each in their concatenation.
+
+    Stable sort merges the sorted runs, so a date present in several arrays maps to the earliest array.
+    """
+    concatenated = np.concatenate(dates)
+    order = np.argsort(concatenated, kind="stable")
+    merged = concatenated[order]
+    if len(merged) == 0:
+        return merged, order
+    unique = np.append(True, merged[1:] != merged[:-1])
+    return merged[unique], order[unique]
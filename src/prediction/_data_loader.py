@@ -1,8 +1,11 @@
-from typing import List, Generic, TypeVar, Callable
+from typing import List, Generic, TypeVar, Callable, Iterator, Optional
 import datetime
+import functools
 import os
 
 from .types import EventData, MonthlyEventData, Balance
+from ._file_cache import ParsedFileCache, load_with_cache
+from ._money import to_cents
 
 
 T = TypeVar("T")
@@ -13,16 +16,40 @@ _DATE_SEP = "."
 
 
 def line_to_balance(line: str) -> Balance:
+    return _line_to_balance(line, float)
+
+
+def line_to_balance_in_cents(line: str) -> Balance:
+    return _line_to_balance(line, to_cents)
+
+
+def line_to_event(line: str) -> EventData:
+    return _line_to_event(line, float)
+
+
+def line_to_event_in_cents(line: str) -> EventData:
+    return _line_to_event(line, to_cents)
+
+
+def line_to_monthly_event(line: str) -> MonthlyEventData:
+    return _line_to_monthly_event(line, float)
+
+
+def line_to_monthly_event_in_cents(line: str) -> MonthlyEventData:
+    return _line_to_monthly_event(line, to_cents)
+
+
+def _line_to_balance(line: str, parse_value: Callable[[str], float]) -> Balance:
     data = line.split(_SEP)
     description = data[0].strip()
-    value = float(data[1].strip())
+    value = parse_value(data[1].strip())
     return Balance(description=description, value=value, date=datetime.date.today())
 
 
-def line_to_event(line: str) -> EventData:
+def _line_to_event(line: str, parse_value: Callable[[str], float]) -> EventData:
     data = line.split(_SEP)
     description = data[0].strip()
-    value = float(data[1].strip())
+    value = parse_value(data[1].strip())
     date_str = data[2].strip()
     try:
         paid = bool(data[3])
@@ -36,10 +63,10 @@ def line_to_event(line: str) -> EventData:
     )
 
 
-def line_to_monthly_event(line: str) -> MonthlyEventData:
+def _line_to_monthly_event(line: str, parse_value: Callable[[str], float]) -> MonthlyEventData:
     data = line.split(_SEP)
     description = data[0].strip()
-    value = float(data[1].strip())
+    value = parse_value(data[1].strip())
     start_date = __date_str_to_date(data[2].strip())
     try:
         end_date_str = data[3].strip()
@@ -65,15 +92,47 @@ def __date_str_to_date(date_str: str) -> datetime.date:
 
 
 class EventsFileReader(Generic[T]):
-    def __init__(self, path: str, transform_func: Callable[[str], T]) -> None:
+    def __init__(
+        self,
+        path: str,
+        transform_func: Callable[[str], T],
+        cache: Optional[ParsedFileCache] = None,
+        cache_kind: Optional[str] = None,
+    ) -> None:
+        """cache_kind names what transform_func produces; by default it is the function qualified name.
+
+        Lambdas, nested functions and partials have no unique name, so without cache_kind they are not cached.
+        """
         self.__path = os.path.realpath(path)
         self.__transform_func = transform_func
+        self.__cache_kind = cache_kind or _get_cache_kind(transform_func)
+        self.__cache = cache if self.__cache_kind is not None else None
 
     def read(self) -> List[T]:
-        events = []
+        return load_with_cache(self.__cache, self.__path, self.__cache_kind, lambda _: list(self.__iter_file()))
+
+    def iter(self) -> Iterator[T]:
+        """Yield transformed lines one by one, without holding the whole file in memory.
+
+        With a cache the whole parsed file is needed to fill it, so events come from read().
+        """
+        if self.__cache is not None:
+            return iter(self.read())
+        return self.__iter_file()
+
+    def __iter_file(self) -> Iterator[T]:
         with open(self.__path) as file:
-            for line in file.readlines()[1:]:
+            next(file, None)
+            for line in file:
                 line = line.strip()
                 if line:
-                    events.append(self.__transform_func(line))
-        return events
+                    yield self.__transform_func(line)
+
+
+def _get_cache_kind(transform_func: Callable) -> Optional[str]:
+    if isinstance(transform_func, functools.partial):
+        return None
+    name = getattr(transform_func, "__qualname__", type(transform_func).__qualname__)
+    if "<lambda>" in name or "<locals>" in name:
+        return None
+    return f"{transform_func.__module__}.{name}"
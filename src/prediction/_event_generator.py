@@ -1,6 +1,11 @@
+import contextlib
 import datetime
-import dataclasses
-from typing import List, Iterable, Optional
+import functools
+import heapq
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import List, Iterable, Iterator, Optional, Callable, TypeVar, Tuple, NamedTuple
+
+import numpy as np
 
 from .types import (
     DataSourcesConfiguration,
@@ -9,54 +14,212 @@ from .types import (
     Event,
     ScenarioConfiguration,
 )
-from ._validation import validate_event_data, validate_monthly_event_data
-from ._data_loader import EventsFileReader, line_to_event, line_to_monthly_event
-from ._helpers import increase_date_by_one_month
+from ._validation import (
+    validate_event_data,
+    validate_monthly_event_data,
+    validate_event_columns,
+    validate_monthly_event_columns,
+)
+from ._data_loader import (
+    EventsFileReader,
+    line_to_event,
+    line_to_monthly_event,
+    line_to_event_in_cents,
+    line_to_monthly_event_in_cents,
+)
+from ._columnar_loader import EventColumns, MonthlyEventColumns, read_event_columns, read_monthly_event_columns
+from ._file_cache import ParsedFileCache, load_with_cache
+from ._recurrence import get_occurrence_range, get_occurrence_array
+from ._event_table import EventTable
+from ._event_index import EventIndex
+from ._helpers import month_index_to_date
+
+
+T = TypeVar("T")
+FileMap = Callable[[Callable[[str], T], Iterable[str]], Iterable[T]]
+Loaders = Tuple[Callable[[str], Iterable], Callable[[str], Iterable]]
+
+
+class _Sources(NamedTuple):
+    monthly_spending: Iterable[Iterable[MonthlyEventData]]
+    monthly_income: Iterable[Iterable[MonthlyEventData]]
+    one_time_income: Iterable[Iterable[EventData]]
+    one_time_spending: Iterable[Iterable[EventData]]
 
 
 class EventGenerator:
-    def __init__(self, config: DataSourcesConfiguration) -> None:
-        self.__one_time_spending_readers = [
-            EventsFileReader[EventData](path=p, transform_func=line_to_event)
-            for p in config.one_time_spending_paths.paths
-        ]
-        self.__one_time_income_readers = [
-            EventsFileReader[EventData](path=p, transform_func=line_to_event)
-            for p in config.one_time_income_paths.paths
-        ]
-        self.__monthly_spending_readers = [
-            EventsFileReader[MonthlyEventData](path=p, transform_func=line_to_monthly_event)
-            for p in config.monthly_spending_paths.paths
-        ]
-        self.__monthly_income_readers = [
-            EventsFileReader[MonthlyEventData](path=p, transform_func=line_to_monthly_event)
-            for p in config.monthly_income_paths.paths
-        ]
+    def __init__(
+        self,
+        config: DataSourcesConfiguration,
+        columnar: bool = False,
+        max_workers: int = 1,
+        use_processes: bool = False,
+        cache: Optional[ParsedFileCache] = None,
+        indexed: bool = False,
+        cents: bool = False,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers={max_workers} must be positive")
+        self.__config = config
+        self.__columnar = columnar
+        self.__max_workers = max_workers
+        self.__use_processes = use_processes
+        self.__cache = cache
+        self.__indexed = indexed
+        self.__cents = cents
+        self.__index: Optional[EventIndex] = None
         self.__paid_events = []
-        self.__skipped_events = []
+        self.__skipped_events: Optional[List[Event]] = []
+        self.__skipped_window: Optional[Tuple[datetime.date, datetime.date]] = None
+
+    @property
+    def cents(self) -> bool:
+        """Whether event values are read as integer cents."""
+        return self.__cents
 
     def get_events(self, config: ScenarioConfiguration) -> List[Event]:
-        events = []
-        events += self.__get_monthly_events(self.__monthly_spending_readers, config, is_income=False)
-        events += self.__get_monthly_events(self.__monthly_income_readers, config, is_income=True)
-        events += self.__get_one_time_events(self.__one_time_income_readers, config, is_income=True)
-        events += self.__get_one_time_events(self.__one_time_spending_readers, config, is_income=False)
-        events.sort(key=lambda e: e.date)
+        self.__paid_events = []
+        self.__skipped_events = []
+        if self.__indexed:
+            monthly_events, one_time_events = self.__query_index(config)
+            events = []
+            for monthly_event, is_income in monthly_events:
+                events += self.__expand_monthly_event(monthly_event, config, is_income)
+            events += one_time_events
+            events.sort(key=_get_event_date)
+            return events
+        with self.__open_sources() as sources:
+            get_one_time_events = self.__get_one_time_events_function()
+            events = []
+            events += self.__get_monthly_events(sources.monthly_spending, config, is_income=False)
+            events += self.__get_monthly_events(sources.monthly_income, config, is_income=True)
+            events += get_one_time_events(sources.one_time_income, config, is_income=True)
+            events += get_one_time_events(sources.one_time_spending, config, is_income=False)
+        events.sort(key=_get_event_date)
         return events
 
+    def iter_events(self, config: ScenarioConfiguration) -> Iterator[Event]:
+        """Merge per-source date-sorted streams lazily, in the same order as get_events.
+
+        All files are read before the first event is returned, so paid and skipped events are already known.
+        Monthly events are expanded while the stream is consumed.
+        """
+        self.__paid_events = []
+        self.__skipped_events = []
+        if self.__indexed:
+            monthly_events, one_time_events = self.__query_index(config)
+            streams = [self.__iter_monthly_event(e, config, is_income) for e, is_income in monthly_events]
+            return heapq.merge(*streams, one_time_events, key=_get_event_date)
+        with self.__open_sources() as sources:
+            get_one_time_events = self.__get_one_time_events_function()
+            streams = []
+            for files, is_income in ((sources.monthly_spending, False), (sources.monthly_income, True)):
+                for file_events in files:
+                    streams += [self.__iter_monthly_event(e, config, is_income) for e in file_events]
+            for files, is_income in ((sources.one_time_income, True), (sources.one_time_spending, False)):
+                for file_events in files:
+                    events = get_one_time_events([file_events], config, is_income)
+                    events.sort(key=_get_event_date)
+                    streams.append(events)
+        return heapq.merge(*streams, key=_get_event_date)
+
+    def get_event_table(self, config: ScenarioConfiguration) -> EventTable:
+        """Same events as get_events, kept as arrays with day-based datetime64 dates.
+
+        Monthly events are expanded into date arrays and, with columnar sources, one-time events
+        stay in arrays too, so no date objects are created for events inside the scenario.
+        """
+        self.__paid_events = []
+        self.__skipped_events = []
+        if self.__indexed:
+            monthly_events, one_time_events = self.__query_index(config)
+            tables = [self.__get_monthly_event_table(e, config, is_income) for e, is_income in monthly_events]
+            tables.append(EventTable.from_events(one_time_events))
+            return EventTable.concatenate(tables).sorted_by_date()
+        with self.__open_sources() as sources:
+            tables = []
+            for files, is_income in ((sources.monthly_spending, False), (sources.monthly_income, True)):
+                for file_events in files:
+                    tables += [self.__get_monthly_event_table(e, config, is_income) for e in file_events]
+            for files, is_income in ((sources.one_time_income, True), (sources.one_time_spending, False)):
+                if self.__columnar:
+                    tables += [self.__get_one_time_event_table(columns, config, is_income) for columns in files]
+                else:
+                    tables.append(EventTable.from_events(self.__get_one_time_events(files, config, is_income)))
+        return EventTable.concatenate(tables).sorted_by_date()
+
     def get_paid_events(self) -> List[Event]:
         return self.__paid_events
 
     def get_skipped_events(self) -> List[Event]:
+        if self.__skipped_events is None:
+            # Indexed queries leave skipped events to be collected only when they are asked for
+            self.__skipped_events = self.__index.get_skipped_events(*self.__skipped_window)
         return self.__skipped_events
 
+    def __query_index(
+        self, config: ScenarioConfiguration
+    ) -> Tuple[List[Tuple[MonthlyEventData, bool]], List[Event]]:
+        if self.__index is None:
+            self.__index = self.__build_index()
+        self.__skipped_events = None
+        self.__skipped_window = (config.start_date, config.end_date)
+        one_time_events = self.__index.get_one_time_events(config.start_date, config.end_date)
+        self.__paid_events = self.__index.paid_events
+        return self.__index.get_monthly_events(config.start_date, config.end_date), one_time_events
+
+    def __build_index(self) -> EventIndex:
+        with self.__open_sources() as sources:
+            monthly_events = [(e, False) for file_events in sources.monthly_spending for e in file_events]
+            monthly_events += [(e, True) for file_events in sources.monthly_income for e in file_events]
+            one_time_events = [(e, True) for file_events in sources.one_time_income for e in file_events]
+            one_time_events += [(e, False) for file_events in sources.one_time_spending for e in file_events]
+        return EventIndex(monthly_events, one_time_events)
+
+    @contextlib.contextmanager
+    def __open_sources(self) -> Iterator[_Sources]:
+        if self.__max_workers == 1:
+            yield self.__map_sources(map, self.__get_loaders(is_concurrent=False))
+            return
+        with self.__create_executor() as executor:
+            map_files = functools.partial(_map_concurrently, executor)
+            yield self.__map_sources(map_files, self.__get_loaders(is_concurrent=True))
+
+    def __create_executor(self) -> Executor:
+        if self.__use_processes:
+            return ProcessPoolExecutor(max_workers=self.__max_workers)
+        return ThreadPoolExecutor(max_workers=self.__max_workers)
+
+    def __map_sources(self, map_files: FileMap, loaders: Loaders) -> _Sources:
+        load_one_time, load_monthly = loaders
+        # All files are scheduled before any of them is consumed, so a concurrent map can overlap the groups
+        return _Sources(
+            monthly_spending=map_files(load_monthly, self.__config.monthly_spending_paths.paths),
+            monthly_income=map_files(load_monthly, self.__config.monthly_income_paths.paths),
+            one_time_income=map_files(load_one_time, self.__config.one_time_income_paths.paths),
+            one_time_spending=map_files(load_one_time, self.__config.one_time_spending_paths.paths),
+        )
+
+    def __get_one_time_events_function(self) -> Callable[[Iterable, ScenarioConfiguration, bool], List[Event]]:
+        if self.__columnar:
+            return self.__get_one_time_events_from_columns
+        return self.__get_one_time_events
+
+    def __get_loaders(self, is_concurrent: bool) -> Loaders:
+        if self.__columnar:
+            loaders = _read_valid_event_columns, _read_valid_monthly_event_columns
+        elif is_concurrent:
+            loaders = _read_valid_events, _read_valid_monthly_events
+        else:
+            loaders = _iter_valid_events, _iter_valid_monthly_events
+        return tuple(functools.partial(loader, cache=self.__cache, cents=self.__cents) for loader in loaders)
+
     def __get_one_time_events(
-        self, readers_iter: Iterable[EventsFileReader], config: ScenarioConfiguration, is_income: bool
+        self, files: Iterable[Iterable[EventData]], config: ScenarioConfiguration, is_income: bool
     ) -> List[Event]:
         events = []
-        for reader in readers_iter:
-            for event_data in reader.read():
-                validate_event_data(event_data)
+        for file_events in files:
+            for event_data in file_events:
                 new_event = Event(
                     description=event_data.description,
                     date=event_data.date,
@@ -70,41 +233,136 @@ class EventGenerator:
                     self.__skipped_events.append(new_event)
         return events
 
-    def __get_monthly_events(
-        self, readers_iter: Iterable[EventsFileReader], config: ScenarioConfiguration, is_income: bool
+    def __get_one_time_events_from_columns(
+        self, files: Iterable[EventColumns], config: ScenarioConfiguration, is_income: bool
     ) -> List[Event]:
         events = []
-        for reader in readers_iter:
-            for monthly_event in reader.read():
-                validate_monthly_event_data(monthly_event)
-                event_template = Event(
-                    description=monthly_event.description,
-                    date=self.__get_first_repetition_date(config.start_date, monthly_event.start_date),
-                    balance_impact=monthly_event.value if is_income else -monthly_event.value
-                )
-                duplicate_end_date = self.__get_last_repetition_date(config.end_date, monthly_event.end_date)
-                events += self.__repeat_montly_event(event_template, duplicate_end_date)
+        start_date = np.datetime64(config.start_date, "D")
+        end_date = np.datetime64(config.end_date, "D")
+        for columns in files:
+            impacts = columns.value if is_income else -columns.value
+            in_scenario = (start_date <= columns.date) & (columns.date <= end_date)
+            rows = zip(
+                columns.description.tolist(),
+                columns.date.tolist(),
+                impacts.tolist(),
+                columns.paid.tolist(),
+                in_scenario.tolist(),
+            )
+            for description, date, balance_impact, paid, is_in_scenario in rows:
+                new_event = Event(description=description, date=date, balance_impact=balance_impact)
+                if paid:
+                    self.__paid_events.append(new_event)
+                elif is_in_scenario:
+                    events.append(new_event)
+                else:
+                    self.__skipped_events.append(new_event)
         return events
 
-    def __get_first_repetition_date(
-        self, config_start_date: datetime.date, event_start_date: Optional[datetime.date]
-    ) -> datetime.date:
-        while event_start_date < config_start_date:
-            event_start_date = increase_date_by_one_month(event_start_date)
-        return event_start_date
-
-    def __get_last_repetition_date(
-        self, config_end_date: datetime.date, event_end_date: Optional[datetime.date]
-    ) -> datetime.date:
-        if event_end_date is None:
-            return config_end_date
-        return min(config_end_date, event_end_date)
-
-    def __repeat_montly_event(self, event_template: Event, end_date: datetime.date) -> List[Event]:
-        log = []
-        while event_template.date <= end_date:
-            log.append(event_template)
-            event_template = dataclasses.replace(
-                event_template, date=increase_date_by_one_month(event_template.date)
+    def __get_one_time_event_table(
+        self, columns: EventColumns, config: ScenarioConfiguration, is_income: bool
+    ) -> EventTable:
+        impacts = columns.value if is_income else -columns.value
+        in_scenario = (
+            ~columns.paid
+            & (np.datetime64(config.start_date, "D") <= columns.date)
+            & (columns.date <= np.datetime64(config.end_date, "D"))
+        )
+        for idx in np.flatnonzero(~in_scenario).tolist():
+            event = Event(
+                description=columns.description[idx].item(),
+                date=columns.date[idx].item(),
+                balance_impact=impacts[idx].item()
             )
-        return log
+            if columns.paid[idx]:
+                self.__paid_events.append(event)
+            else:
+                self.__skipped_events.append(event)
+        return EventTable(
+            dates=columns.date[in_scenario],
+            impacts=impacts[in_scenario],
+            descriptions=columns.description[in_scenario].astype(object),
+        )
+
+    def __get_monthly_event_table(
+        self, monthly_event: MonthlyEventData, config: ScenarioConfiguration, is_income: bool
+    ) -> EventTable:
+        dates = get_occurrence_array(monthly_event, config.start_date, config.end_date)
+        balance_impact = monthly_event.value if is_income else -monthly_event.value
+        return EventTable(
+            dates=dates,
+            impacts=np.full(len(dates), balance_impact),
+            descriptions=np.full(len(dates), monthly_event.description, dtype=object),
+        )
+
+    def __get_monthly_events(
+        self, files: Iterable[Iterable[MonthlyEventData]], config: ScenarioConfiguration, is_income: bool
+    ) -> List[Event]:
+        events = []
+        for file_events in files:
+            for monthly_event in file_events:
+                events += self.__expand_monthly_event(monthly_event, config, is_income)
+        return events
+
+    def __expand_monthly_event(
+        self, monthly_event: MonthlyEventData, config: ScenarioConfiguration, is_income: bool
+    ) -> List[Event]:
+        return list(self.__iter_monthly_event(monthly_event, config, is_income))
+
+    def __iter_monthly_event(
+        self, monthly_event: MonthlyEventData, config: ScenarioConfiguration, is_income: bool
+    ) -> Iterator[Event]:
+        balance_impact = monthly_event.value if is_income else -monthly_event.value
+        first, count = get_occurrence_range(monthly_event, config.start_date, config.end_date)
+        for index in range(first, first + count):
+            date = month_index_to_date(index, monthly_event.month_day)
+            yield Event(description=monthly_event.description, date=date, balance_impact=balance_impact)
+
+
+def _get_event_date(event: Event) -> datetime.date:
+    return event.date
+
+
+def _map_concurrently(executor: Executor, func: Callable[[str], T], paths: Iterable[str]) -> Iterator[T]:
+    futures = [executor.submit(func, path) for path in paths]
+    return (future.result() for future in futures)
+
+
+def _iter_valid_events(path: str, cache: Optional[ParsedFileCache], cents: bool) -> Iterator[EventData]:
+    transform_func = line_to_event_in_cents if cents else line_to_event
+    kind = "events_in_cents" if cents else "events"
+    reader = EventsFileReader[EventData](path=path, transform_func=transform_func, cache=cache, cache_kind=kind)
+    for event_data in reader.iter():
+        validate_event_data(event_data)
+        yield event_data
+
+
+def _iter_valid_monthly_events(path: str, cache: Optional[ParsedFileCache], cents: bool) -> Iterator[MonthlyEventData]:
+    transform_func = line_to_monthly_event_in_cents if cents else line_to_monthly_event
+    kind = "monthly_events_in_cents" if cents else "monthly_events"
+    reader = EventsFileReader[MonthlyEventData](path=path, transform_func=transform_func, cache=cache, cache_kind=kind)
+    for monthly_event in reader.iter():
+        validate_monthly_event_data(monthly_event)
+        yield monthly_event
+
+
+def _read_valid_events(path: str, cache: Optional[ParsedFileCache], cents: bool) -> List[EventData]:
+    return list(_iter_valid_events(path, cache, cents))
+
+
+def _read_valid_monthly_events(path: str, cache: Optional[ParsedFileCache], cents: bool) -> List[MonthlyEventData]:
+    return list(_iter_valid_monthly_events(path, cache, cents))
+
+
+def _read_valid_event_columns(path: str, cache: Optional[ParsedFileCache], cents: bool) -> EventColumns:
+    kind = "event_columns_in_cents" if cents else "event_columns"
+    columns = load_with_cache(cache, path, kind, functools.partial(read_event_columns, cents=cents))
+    validate_event_columns(columns)
+    return columns
+
+
+def _read_valid_monthly_event_columns(path: str, cache: Optional[ParsedFileCache], cents: bool) -> MonthlyEventColumns:
+    kind = "monthly_event_columns_in_cents" if cents else "monthly_event_columns"
+    columns = load_with_cache(cache, path, kind, functools.partial(read_monthly_event_columns, cents=cents))
+    validate_monthly_event_columns(columns)
+    return columns
@@ -0,0 +1,127 @@
+from __future__ import annotations
+from typing import List, Optional, Tuple, Generic, TypeVar
+import bisect
+import datetime
+
+from .types import Event, EventData, MonthlyEventData
+
+
+T = TypeVar("T")
+
+
+class IntervalTree(Generic[T]):
+    """Static centered interval tree over closed date intervals."""
+
+    def __init__(self, intervals: List[Tuple[datetime.date, datetime.date, T]]) -> None:
+        self.__root = _IntervalNode.build(intervals)
+
+    def query(self, start: datetime.date, end: datetime.date) -> List[T]:
+        result = []
+        if self.__root is not None:
+            self.__root.collect(start, end, result)
+        return result
+
+
+class _IntervalNode(Generic[T]):
+    def __init__(self, center: datetime.date, intervals: List[Tuple[datetime.date, datetime.date, T]]) -> None:
+        self.center = center
+        self.by_start = sorted(intervals, key=lambda i: i[0])
+        self.by_end = sorted(intervals, key=lambda i: i[1], reverse=True)
+        self.left: Optional[_IntervalNode] = None
+        self.right: Optional[_IntervalNode] = None
+
+    @classmethod
+    def build(cls, intervals: List[Tuple[datetime.date, datetime.date, T]]) -> Optional[_IntervalNode]:
+        if not intervals:
+            return None
+        bounds = sorted(bound for interval in intervals for bound in interval[:2])
+        center = bounds[len(bounds) // 2]
+        node = cls(center, [i for i in intervals if i[0] <= center <= i[1]])
+        node.left = cls.build([i for i in intervals if i[1] < center])
+        node.right = cls.build([i for i in intervals if i[0] > center])
+        return node
+
+    def collect(self, start: datetime.date, end: datetime.date, result: List[T]) -> None:
+        if end < self.center:
+            for interval_start, _, value in self.by_start:
+                if interval_start > end:
+                    break
+                result.append(value)
+            if self.left is not None:
+                self.left.collect(start, end, result)
+        elif start > self.center:
+            for _, interval_end, value in self.by_end:
+                if interval_end < start:
+                    break
+                result.append(value)
+            if self.right is not None:
+                self.right.collect(start, end, result)
+        else:
+            result += [value for _, _, value in self.by_start]
+            if self.left is not None:
+                self.left.collect(start, end, result)
+            if self.right is not None:
+                self.right.collect(start, end, result)
+
+
+class EventIndex:
+    """Parsed event sources indexed by date, answering scenario windows without re-reading files.
+
+    Sources are given in get_events order. Query results keep that order for equal dates,
+    so events built from the index sort exactly like the ones built from files.
+    """
+
+    def __init__(
+        self,
+        monthly_events: List[Tuple[MonthlyEventData, bool]],
+        one_time_events: List[Tuple[EventData, bool]],
+    ) -> None:
+        self.__monthly_tree = IntervalTree[Tuple[int, MonthlyEventData, bool]](
+            [
+                (event.start_date, event.end_date or datetime.date.max, (position, event, is_income))
+                for position, (event, is_income) in enumerate(monthly_events)
+            ]
+        )
+        self.__paid_events: List[Event] = []
+        unpaid: List[Tuple[int, Event]] = []
+        for position, (event_data, is_income) in enumerate(one_time_events):
+            event = Event(
+                description=event_data.description,
+                date=event_data.date,
+                balance_impact=event_data.value if is_income else -event_data.value
+            )
+            if event_data.paid:
+                self.__paid_events.append(event)
+            else:
+                unpaid.append((position, event))
+        unpaid.sort(key=lambda item: item[1].date)
+        self.__one_time_events = [event for _, event in unpaid]
+        self.__one_time_dates = [event.date for event in self.__one_time_events]
+        # Rank in date order of every unpaid event, kept in source order for skipped events
+        by_position = sorted((position, rank, event) for rank, (position, event) in enumerate(unpaid))
+        self.__ranked_events = [(rank, event) for _, rank, event in by_position]
+
+    @property
+    def paid_events(self) -> List[Event]:
+        return list(self.__paid_events)
+
+    def get_monthly_events(self, start: datetime.date, end: datetime.date) -> List[Tuple[MonthlyEventData, bool]]:
+        active = self.__monthly_tree.query(start, end)
+        active.sort(key=lambda item: item[0])
+        return [(event, is_income) for _, event, is_income in active]
+
+    def get_one_time_events(self, start: datetime.date, end: datetime.date) -> List[Event]:
+        """Return unpaid one-time events inside [start, end] sorted by date."""
+        first, last = self.__one_time_window(start, end)
+        return self.__one_time_events[first:last]
+
+    def get_skipped_events(self, start: datetime.date, end: datetime.date) -> List[Event]:
+        """Return unpaid one-time events outside [start, end] in source order.
+
+        This visits every unpaid event, so it is kept apart from the O(log N + k) window query.
+        """
+        first, last = self.__one_time_window(start, end)
+        return [event for rank, event in self.__ranked_events if not first <= rank < last]
+
+    def __one_time_window(self, start: datetime.date, end: datetime.date) -> Tuple[int, int]:
+        return bisect.bisect_left(self.__one_time_dates, start), bisect.bisect_right(self.__one_time_dates, end)
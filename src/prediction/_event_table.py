@@ -0,0 +1,77 @@
+from __future__ import annotations
+from collections.abc import Sequence
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+
+from .types import Event
+
+
+class EventTable(Sequence):
+    """Events kept as arrays; Event objects are created only when items are accessed."""
+
+    def __init__(self, dates: np.ndarray, impacts: np.ndarray, descriptions: Optional[np.ndarray] = None) -> None:
+        self.__dates = dates.astype("datetime64[D]")
+        self.__impacts = impacts
+        self.__descriptions = descriptions
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event], with_descriptions: bool = True) -> EventTable:
+        events = list(events)
+        return cls(
+            dates=np.array([e.date for e in events], dtype="datetime64[D]"),
+            impacts=np.array([e.balance_impact for e in events]),
+            descriptions=np.array([e.description for e in events], dtype=object) if with_descriptions else None,
+        )
+
+    @classmethod
+    def concatenate(cls, tables: Sequence[EventTable]) -> EventTable:
+        if not tables:
+            return cls(dates=np.array([], dtype="datetime64[D]"), impacts=np.array([], dtype=np.float64))
+        # Empty tables carry no impacts; they must not promote integer cents to float
+        tables = [t for t in tables if len(t)] or tables[:1]
+        descriptions = [t.descriptions for t in tables]
+        return cls(
+            dates=np.concatenate([t.dates for t in tables]),
+            impacts=np.concatenate([t.impacts for t in tables]),
+            descriptions=None if any(d is None for d in descriptions) else np.concatenate(descriptions),
+        )
+
+    def sorted_by_date(self) -> EventTable:
+        """Stable sort, so events with equal dates keep their order."""
+        order = np.argsort(self.__dates, kind="stable")
+        return EventTable(
+            dates=self.__dates[order],
+            impacts=self.__impacts[order],
+            descriptions=None if self.__descriptions is None else self.__descriptions[order],
+        )
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.__dates
+
+    @property
+    def impacts(self) -> np.ndarray:
+        return self.__impacts
+
+    @property
+    def descriptions(self) -> Optional[np.ndarray]:
+        return self.__descriptions
+
+    def __len__(self) -> int:
+        return len(self.__dates)
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[Event, List[Event]]:
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError("EventTable index out of range")
+        description = "" if self.__descriptions is None else self.__descriptions[idx]
+        return Event(description=description, date=self.__dates[idx].item(), balance_impact=self.__impacts[idx].item())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (EventTable, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
@@ -0,0 +1,99 @@
+from typing import Callable, List, Optional, TypeVar
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+
+
+T = TypeVar("T")
+
+
+_ENTRY_SUFFIX = ".pickle"
+# Part of every entry key; bump it whenever pickled parse results change layout, e.g. slotted event types
+_FORMAT_VERSION = 2
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+class ParsedFileCache:
+    """On-disk cache of parsed event files.
+
+    Entries are keyed by the file realpath, modification time and size, so editing a file
+    invalidates its entry. The least recently used entries are removed once the cache
+    directory grows above max_size bytes.
+    """
+
+    def __init__(self, directory: str, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.__directory = os.path.realpath(directory)
+        self.__max_size = max_size
+        os.makedirs(self.__directory, exist_ok=True)
+
+    def load(self, path: str, kind: str, parse: Callable[[str], T]) -> T:
+        entry_path = self.__entry_path(path, kind)
+        try:
+            return self.__read_entry(entry_path)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            pass
+        parsed = parse(path)
+        self.__write_entry(entry_path, parsed)
+        self.__evict()
+        return parsed
+
+    def clear(self) -> None:
+        for entry in self.__entries():
+            _remove_if_exists(entry.path)
+
+    def __entry_path(self, path: str, kind: str) -> str:
+        real_path = os.path.realpath(path)
+        stat = os.stat(real_path)
+        key = f"{_FORMAT_VERSION}|{real_path}|{stat.st_mtime_ns}|{stat.st_size}|{kind}"
+        file_name = hashlib.sha256(key.encode()).hexdigest() + _ENTRY_SUFFIX
+        return os.path.join(self.__directory, file_name)
+
+    def __read_entry(self, entry_path: str) -> T:
+        with open(entry_path, "rb") as file:
+            parsed = pickle.load(file)
+        # Another process or thread may evict the entry right after it was read
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(entry_path)
+        return parsed
+
+    def __write_entry(self, entry_path: str, parsed: T) -> None:
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=self.__directory)
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                pickle.dump(parsed, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def __evict(self) -> None:
+        entries = []
+        for entry in self.__entries():
+            try:
+                entries.append((entry.path, entry.stat()))
+            except FileNotFoundError:
+                continue
+        entries.sort(key=lambda e: e[1].st_mtime_ns)
+        total_size = sum(stat.st_size for _, stat in entries)
+        for path, stat in entries:
+            if total_size <= self.__max_size:
+                break
+            total_size -= stat.st_size
+            _remove_if_exists(path)
+
+    def __entries(self) -> List[os.DirEntry]:
+        return [e for e in os.scandir(self.__directory) if e.name.endswith(_ENTRY_SUFFIX)]
+
+
+def _remove_if_exists(path: str) -> None:
+    # Entries can be evicted concurrently by other readers of the same cache directory
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def load_with_cache(cache: Optional[ParsedFileCache], path: str, kind: str, parse: Callable[[str], T]) -> T:
+    if cache is None:
+        return parse(path)
+    return cache.load(path, kind, parse)
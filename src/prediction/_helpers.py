@@ -6,3 +6,19 @@ def increase_date_by_one_month(date: datetime.date) -> datetime.date:
     if next_month < 13:
         return datetime.date.replace(date, month=next_month)
     return datetime.date.replace(date, year=date.year + 1, month=1)
+
+
+def month_index(date: datetime.date) -> int:
+    return date.year * 12 + date.month - 1
+
+
+def month_index_to_date(index: int, day: int) -> datetime.date:
+    year, month = divmod(index, 12)
+    return datetime.date(year=year, month=month + 1, day=day)
+
+
+def to_naive_utc(value: datetime.date) -> datetime.date:
+    """Return aware datetimes as naive UTC; numpy datetime64 has no time zones."""
+    if isinstance(value, datetime.datetime) and value.utcoffset() is not None:
+        return value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
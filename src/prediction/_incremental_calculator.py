@@ -0,0 +1,93 @@
+from collections import Counter
+from fractions import Fraction
+from typing import Iterable, List, Union
+import datetime
+
+from .types import Event, Balance
+from .errors import CalculatorError
+from ._balance_calculator import BalanceLogCalulator
+
+
+class _FenwickTree:
+    """Prefix sums of exact values; floats must be given as Fractions so removals cancel additions exactly."""
+
+    def __init__(self, size: int) -> None:
+        self.__tree = [0] * (size + 1)
+
+    def add(self, idx: int, value: Union[int, Fraction]) -> None:
+        idx += 1
+        while idx < len(self.__tree):
+            self.__tree[idx] += value
+            idx += idx & -idx
+
+    def prefix_sum(self, idx: int) -> Union[int, Fraction]:
+        """Sum of values at positions [0, idx]."""
+        result = 0
+        idx += 1
+        while idx > 0:
+            result += self.__tree[idx]
+            idx -= idx & -idx
+        return result
+
+
+class IncrementalBalanceCalculator:
+    """Keeps daily balance deltas in a Fenwick tree, so single event edits and balance queries cost O(log days).
+
+    Like BalanceLogCalulator, events dated before the initial balance do not change it.
+    """
+
+    def __init__(self, initial: Balance, end_date: datetime.date, events: Iterable[Event] = ()) -> None:
+        if end_date < initial.date:
+            raise CalculatorError(f"End date {end_date} is before initial balance date {initial.date}")
+        self.__initial = initial
+        self.__end_date = end_date
+        self.__deltas = _FenwickTree((end_date - initial.date).days + 1)
+        self.__events: Counter[Event] = Counter()
+        for event in events:
+            self.add_event(event)
+
+    def add_event(self, event: Event) -> None:
+        self.__validate_date(event.date)
+        self.__events[event] += 1
+        if event.date >= self.__initial.date:
+            self.__deltas.add(self.__day(event.date), _exact(event.balance_impact))
+
+    def remove_event(self, event: Event) -> None:
+        if self.__events[event] == 0:
+            raise CalculatorError(f"Unknown event {event}")
+        self.__events[event] -= 1
+        if self.__events[event] == 0:
+            del self.__events[event]
+        if event.date >= self.__initial.date:
+            self.__deltas.add(self.__day(event.date), -_exact(event.balance_impact))
+
+    def replace_event(self, old: Event, new: Event) -> None:
+        self.__validate_date(new.date)
+        self.remove_event(old)
+        self.add_event(new)
+
+    def balance_at(self, date: datetime.date) -> float:
+        """Balance at the end of the given day.
+
+        Float amounts are summed exactly and rounded once, so the answer does not depend on the edit history.
+        """
+        if date < self.__initial.date:
+            raise CalculatorError(f"Balance log starts at {self.__initial.date}")
+        day = min(self.__day(date), self.__day(self.__end_date))
+        balance = _exact(self.__initial.value) + self.__deltas.prefix_sum(day)
+        return float(balance) if isinstance(balance, Fraction) else balance
+
+    def get_balance_log(self) -> List[Balance]:
+        events = sorted(self.__events.elements(), key=lambda e: e.date)
+        return BalanceLogCalulator(events).get_balance_log(self.__initial)
+
+    def __validate_date(self, date: datetime.date) -> None:
+        if date > self.__end_date:
+            raise CalculatorError(f"Event date {date} is after calculator end date {self.__end_date}")
+
+    def __day(self, date: datetime.date) -> int:
+        return (date - self.__initial.date).days
+
+
+def _exact(value: float) -> Union[int, Fraction]:
+    return Fraction(value) if isinstance(value, float) else value
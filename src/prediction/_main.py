@@ -1,12 +1,15 @@
+import bisect
 import datetime
 import dataclasses
+import numbers
 import os
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Iterable
 
-from .types import ScenarioConfiguration, DataSourcesConfiguration, EventsDataPaths, Balance
+from .types import ScenarioConfiguration, DataSourcesConfiguration, EventsDataPaths, Balance, Event
 from ._balance_calculator import BalanceLogCalulator, ReportDay
 from ._event_generator import EventGenerator
-from ._data_loader import line_to_balance, EventsFileReader
+from ._data_loader import line_to_balance, line_to_balance_in_cents, EventsFileReader
 from .cli import BalanceLogPrinter
 
 
@@ -22,24 +25,64 @@ class MainCfg:
     end_date: datetime.date
     start_date: Optional[datetime.date] = datetime.date.today()
     report_days: List[ReportDay] = dataclasses.field(default_factory=list)
+    cents: bool = False
+
+    def __post_init__(self) -> None:
+        if self.cents and not isinstance(self.start_balance, numbers.Integral):
+            raise ValueError(
+                f"start_balance must be integer cents when cents is set, got {self.start_balance!r}; use to_cents"
+            )
 
 
 def show_balance(config: MainCfg, event_gen: EventGenerator) -> None:
     # TODO: change to func accepting file-like object to make it possible to print into file or another terminal
+    _check_cents(config, event_gen)
     scenario_config = ScenarioConfiguration(
         start_date=config.start_date, end_date=config.end_date,
     )
-    events = event_gen.get_events(scenario_config)
-    calculator = BalanceLogCalulator(events)
-    balance_log = calculator.get_balance_log(Balance("Initial", config.start_date, config.start_balance))
-    if config.report_days:
-        balance_log = calculator.get_balance_at_report_day(*config.report_days)
+    balance_log = _get_balance_log(config, event_gen.iter_events(scenario_config))
     # TODO: Test event gen and crate event printer
     print("Skipped Events:")
     for e in event_gen.get_skipped_events():
         print(e)
     print("Balance Log:")  # TODO: move to balance log printer
-    BalanceLogPrinter(balance_log).print_all()
+    BalanceLogPrinter(balance_log, cents=config.cents).print_all()
+
+
+def get_balance_logs(configs: List[MainCfg], event_gen: EventGenerator, max_workers: int = 1) -> List[List[Balance]]:
+    """Calculate one balance log per config, reading and sorting events once for all of them."""
+    if not configs:
+        return []
+    for config in configs:
+        _check_cents(config, event_gen)
+    common_scenario = ScenarioConfiguration(
+        start_date=min(c.start_date for c in configs), end_date=max(c.end_date for c in configs),
+    )
+    events = event_gen.get_events(common_scenario)
+    dates = [e.date for e in events]
+    scenario_events = [
+        events[bisect.bisect_left(dates, c.start_date):bisect.bisect_right(dates, c.end_date)] for c in configs
+    ]
+    if max_workers == 1:
+        return list(map(_get_balance_log, configs, scenario_events))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_get_balance_log, configs, scenario_events))
+
+
+def _check_cents(config: MainCfg, event_gen: EventGenerator) -> None:
+    if config.cents != event_gen.cents:
+        raise ValueError(
+            f"MainCfg.cents={config.cents} does not match EventGenerator.cents={event_gen.cents}; "
+            "balances and events must use the same unit"
+        )
+
+
+def _get_balance_log(config: MainCfg, events: Iterable[Event]) -> List[Balance]:
+    calculator = BalanceLogCalulator(events)
+    balance_log = calculator.get_balance_log(Balance("Initial", config.start_date, config.start_balance))
+    if config.report_days:
+        balance_log = calculator.get_balance_at_report_day(*config.report_days)
+    return balance_log
 
 
 def build_data_sources_configuration(folder_path: str) -> DataSourcesConfiguration:
@@ -69,8 +112,8 @@ def build_data_sources_configuration(folder_path: str) -> DataSourcesConfigurati
     )
 
 
-def read_initial_balance(file_path: str) -> float:
-    reader = EventsFileReader[Balance](file_path, line_to_balance)
+def read_initial_balance(file_path: str, cents: bool = False) -> float:
+    reader = EventsFileReader[Balance](file_path, line_to_balance_in_cents if cents else line_to_balance)
     result = 0
     for balance in reader.read():
         result += balance.value
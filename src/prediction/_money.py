@@ -0,0 +1,48 @@
+import decimal
+import numbers
+
+import numpy as np
+
+
+CENTS_PER_UNIT = 100
+
+
+def to_cents(text: str) -> int:
+    """Parse a decimal amount like '12.34' into exact integer cents."""
+    try:
+        cents = decimal.Decimal(text.strip()).scaleb(2)
+    except decimal.InvalidOperation as err:
+        raise ValueError(f"Invalid amount {text!r}") from err
+    if cents != cents.to_integral_value():
+        raise ValueError(f"Amount {text!r} has fractions of a cent")
+    return int(cents)
+
+
+def to_cents_array(texts: np.ndarray) -> np.ndarray:
+    """Vectorized to_cents: integer and fraction digits are parsed separately, so no float rounding is involved."""
+    texts = np.char.strip(texts)
+    if texts.size == 0:
+        return np.array([], dtype=np.int64)
+    parts = np.char.partition(texts, ".")
+    units, fraction = parts[..., 0], np.char.rstrip(parts[..., 2], "0")
+    digits = np.char.lstrip(units, "+-")
+    is_plain = (
+        np.char.isdigit(digits)
+        & (np.char.str_len(units) - np.char.str_len(digits) <= 1)
+        & (np.char.isdigit(fraction) | (np.char.str_len(fraction) == 0))
+    )
+    if not np.all(is_plain):
+        # Exponents and other forms Decimal accepts are rare; parse them one by one
+        return np.array([to_cents(str(text)) for text in texts], dtype=np.int64)
+    if np.any(np.char.str_len(fraction) > 2):
+        raise ValueError("Amounts have fractions of a cent")
+    cents = digits.astype(np.int64) * CENTS_PER_UNIT + np.char.ljust(fraction, 2, "0").astype(np.int64)
+    return np.where(np.char.startswith(units, "-"), -cents, cents)
+
+
+def format_cents(cents: int) -> str:
+    if not isinstance(cents, numbers.Integral):
+        raise ValueError(f"Amount in cents must be an integer, got {cents!r}")
+    units, rest = divmod(abs(cents), CENTS_PER_UNIT)
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{units:_}.{rest:02d}"
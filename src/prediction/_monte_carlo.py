@@ -0,0 +1,172 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence, Tuple
+import dataclasses
+
+import numpy as np
+
+from .types import DataSourcesConfiguration, EventsDataPaths, ScenarioConfiguration
+from ._event_generator import EventGenerator
+from ._event_table import EventTable
+from ._file_cache import ParsedFileCache
+
+
+DEFAULT_PERCENTILES = (5.0, 25.0, 50.0, 75.0, 95.0)
+DEFAULT_BATCH_SIZE = 256
+
+
+@dataclasses.dataclass(frozen=True)
+class Perturbation:
+    """Per-event distributions used to sample scenarios.
+
+    Every income may be paid up to max_income_delay days late (uniformly), every spending
+    is scaled by a uniform factor in [1 - spending_variation, 1 + spending_variation] and every
+    one-time event happens with one_time_probability.
+    """
+    max_income_delay: int = 0
+    spending_variation: float = 0.0
+    one_time_probability: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.max_income_delay < 0:
+            raise ValueError("max_income_delay must not be negative")
+        if not 0 <= self.spending_variation <= 1:
+            raise ValueError("spending_variation must be between 0 and 1")
+        if not 0 <= self.one_time_probability <= 1:
+            raise ValueError("one_time_probability must be between 0 and 1")
+
+
+@dataclasses.dataclass(frozen=True)
+class ForecastBands:
+    dates: np.ndarray
+    percentiles: Tuple[float, ...]
+    bands: np.ndarray
+    overdraft_probability: np.ndarray
+
+    def band(self, percentile: float) -> np.ndarray:
+        return self.bands[self.percentiles.index(percentile)]
+
+
+@dataclasses.dataclass(frozen=True)
+class _BaseEvents:
+    days: np.ndarray
+    impacts: np.ndarray
+    one_time: np.ndarray
+
+
+class MonteCarloForecast:
+    """Samples perturbed scenarios of the configured events and summarizes their daily balances.
+
+    Samples are drawn in batches of batch_size, each from its own RNG stream spawned from seed,
+    so results for a given seed do not depend on max_workers.
+    """
+
+    def __init__(
+        self,
+        config: DataSourcesConfiguration,
+        perturbation: Perturbation,
+        columnar: bool = False,
+        cache: Optional[ParsedFileCache] = None,
+    ) -> None:
+        no_paths = EventsDataPaths(())
+        self.__monthly_generator = EventGenerator(
+            dataclasses.replace(config, one_time_spending_paths=no_paths, one_time_income_paths=no_paths),
+            columnar=columnar,
+            cache=cache,
+        )
+        self.__one_time_generator = EventGenerator(
+            dataclasses.replace(config, monthly_spending_paths=no_paths, monthly_income_paths=no_paths),
+            columnar=columnar,
+            cache=cache,
+        )
+        self.__perturbation = perturbation
+
+    def simulate(
+        self,
+        config: ScenarioConfiguration,
+        start_balance: float,
+        n_samples: int,
+        seed: Optional[int] = None,
+        percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+        max_workers: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ForecastBands:
+        if n_samples < 1:
+            raise ValueError("n_samples must be at least 1")
+        balances = self.sample_daily_balances(config, start_balance, n_samples, seed, max_workers, batch_size)
+        percentiles = tuple(float(p) for p in percentiles)
+        return ForecastBands(
+            dates=np.arange(np.datetime64(config.start_date, "D"), np.datetime64(config.end_date, "D") + 1),
+            percentiles=percentiles,
+            bands=np.percentile(balances, percentiles, axis=0),
+            overdraft_probability=np.mean(balances < 0, axis=0),
+        )
+
+    def sample_daily_balances(
+        self,
+        config: ScenarioConfiguration,
+        start_balance: float,
+        n_samples: int,
+        seed: Optional[int] = None,
+        max_workers: int = 1,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> np.ndarray:
+        """Return a (n_samples, n_days) array with the end-of-day balance of every sampled scenario."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        base = self.__get_base_events(config)
+        n_days = (config.end_date - config.start_date).days + 1
+        batch_sizes = [min(batch_size, n_samples - first) for first in range(0, n_samples, batch_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(batch_sizes))
+        arguments = (
+            [base] * len(batch_sizes),
+            [self.__perturbation] * len(batch_sizes),
+            [n_days] * len(batch_sizes),
+            [start_balance] * len(batch_sizes),
+            batch_sizes,
+            seeds,
+        )
+        if max_workers == 1:
+            batches = list(map(_simulate_batch, *arguments))
+        else:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                batches = list(executor.map(_simulate_batch, *arguments))
+        return np.concatenate(batches)
+
+    def __get_base_events(self, config: ScenarioConfiguration) -> _BaseEvents:
+        monthly = self.__monthly_generator.get_event_table(config)
+        one_time = self.__one_time_generator.get_event_table(config)
+        events = EventTable.concatenate([monthly, one_time])
+        return _BaseEvents(
+            days=(events.dates - np.datetime64(config.start_date, "D")).astype(np.int64),
+            impacts=events.impacts.astype(np.float64),
+            one_time=np.arange(len(events)) >= len(monthly),
+        )
+
+
+def _simulate_batch(
+    base: _BaseEvents,
+    perturbation: Perturbation,
+    n_days: int,
+    start_balance: float,
+    n_samples: int,
+    seed: np.random.SeedSequence,
+) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    shape = (n_samples, len(base.impacts))
+    income = base.impacts > 0
+    days = base.days + rng.integers(0, perturbation.max_income_delay, size=shape, endpoint=True) * income
+    scale = 1 + rng.uniform(-perturbation.spending_variation, perturbation.spending_variation, size=shape) * ~income
+    happens = ~base.one_time | (rng.random(size=shape) < perturbation.one_time_probability)
+    impacts = base.impacts * scale * happens
+    return _daily_balances(days, impacts, n_days, start_balance)
+
+
+def _daily_balances(days: np.ndarray, impacts: np.ndarray, n_days: int, start_balance: float) -> np.ndarray:
+    """Sum impacts per (sample, day) and accumulate them; events slipping past the last day are dropped."""
+    n_samples = len(days)
+    in_window = days < n_days
+    rows = np.broadcast_to(np.arange(n_samples)[:, np.newaxis], days.shape)
+    flat_index = rows[in_window] * n_days + days[in_window]
+    daily_impacts = np.bincount(flat_index, weights=impacts[in_window], minlength=n_samples * n_days)
+    return start_balance + np.cumsum(daily_impacts.reshape(n_samples, n_days), axis=1)
@@ -0,0 +1,42 @@
+import datetime
+from typing import List, Tuple
+
+import numpy as np
+
+from .types import MonthlyEventData
+from ._helpers import month_index, month_index_to_date
+
+
+_NUMPY_EPOCH_MONTH_INDEX = 1970 * 12
+
+
+def get_occurrence_range(
+    monthly_event: MonthlyEventData, start_date: datetime.date, end_date: datetime.date
+) -> Tuple[int, int]:
+    """Return month index of the first occurrence within [start_date, end_date] and the number of occurrences."""
+    if monthly_event.end_date is not None:
+        end_date = min(end_date, monthly_event.end_date)
+    day = monthly_event.month_day
+    first = max(month_index(monthly_event.start_date), month_index(start_date) + (day < start_date.day))
+    last = month_index(end_date) - (day > end_date.day)
+    return first, max(0, last - first + 1)
+
+
+def get_occurrence_dates(
+    monthly_event: MonthlyEventData, start_date: datetime.date, end_date: datetime.date
+) -> List[datetime.date]:
+    first, count = get_occurrence_range(monthly_event, start_date, end_date)
+    return [month_index_to_date(index, monthly_event.month_day) for index in range(first, first + count)]
+
+
+def get_occurrence_array(
+    monthly_event: MonthlyEventData, start_date: datetime.date, end_date: datetime.date
+) -> np.ndarray:
+    first, count = get_occurrence_range(monthly_event, start_date, end_date)
+    first -= _NUMPY_EPOCH_MONTH_INDEX
+    months = np.arange(first, first + count).astype("datetime64[M]")
+    dates = months.astype("datetime64[D]") + (monthly_event.month_day - 1)
+    # Like get_occurrence_dates, a month day missing in some month is an error rather than a roll over
+    if np.any(dates.astype("datetime64[M]") != months):
+        raise ValueError(f"day {monthly_event.month_day} is out of range for some month")
+    return dates
@@ -1,7 +1,15 @@
 import datetime
+from typing import Union
+
+import numpy as np
 
 from .types import EventData, MonthlyEventData
 from .errors import ValidationError
+from ._columnar_loader import EventColumns, MonthlyEventColumns
+
+
+# Later days do not occur in every month, as for report days
+_MAX_MONTH_DAY = 28
 
 
 def validate_event_data(event: EventData) -> None:
@@ -21,6 +29,7 @@ def validate_monthly_event_data(event: MonthlyEventData) -> None:
         or not event.description
         or not isinstance(event.start_date, datetime.date)
         or event.month_day != event.start_date.day
+        or event.month_day > _MAX_MONTH_DAY
     ):
         raise ValidationError(event)
     if event.end_date is not None:
@@ -30,3 +39,26 @@ def validate_monthly_event_data(event: MonthlyEventData) -> None:
             or event.end_date.day != event.start_date.day
         ):
             raise ValidationError(event)
+
+
+def validate_event_columns(events: EventColumns) -> None:
+    invalid = (events.value <= 0) | (np.char.str_len(events.description) == 0)
+    _raise_on_first_invalid(events, invalid)
+
+
+def validate_monthly_event_columns(events: MonthlyEventColumns) -> None:
+    has_end = ~np.isnat(events.end_date)
+    end_day = (events.end_date - events.end_date.astype("datetime64[M]")).astype(np.int64) + 1
+    invalid = (
+        (events.value <= 0)
+        | (np.char.str_len(events.description) == 0)
+        | (has_end & (events.start_date > events.end_date))
+        | (has_end & (end_day != events.month_day))
+        | (events.month_day > _MAX_MONTH_DAY)
+    )
+    _raise_on_first_invalid(events, invalid)
+
+
+def _raise_on_first_invalid(events: Union[EventColumns, MonthlyEventColumns], invalid: np.ndarray) -> None:
+    if np.any(invalid):
+        raise ValidationError(events.row(int(np.argmax(invalid))))
@@ -0,0 +1,79 @@
+from __future__ import annotations
+from typing import Iterable, Optional
+import datetime
+
+import numpy as np
+
+from .types import Event, Balance
+from .errors import CalculatorError
+from ._balance_series import BalanceSeries
+from ._event_table import EventTable
+
+
+class VectorizedBalanceLogCalculator:
+    """NumPy counterpart of BalanceLogCalulator.get_balance_log.
+
+    Events are grouped by date and balances come from one cumulative sum, which adds
+    impacts in the same order as the event-by-event calculator does.
+    """
+
+    def __init__(self, dates: np.ndarray, impacts: np.ndarray, descriptions: Optional[np.ndarray] = None) -> None:
+        order = np.argsort(dates, kind="stable")
+        self.__dates = dates.astype("datetime64[D]")[order]
+        self.__impacts = impacts[order]
+        self.__descriptions = None if descriptions is None else np.asarray(descriptions, dtype=object)[order]
+
+    @classmethod
+    def from_events(cls, events: Iterable[Event], with_descriptions: bool = True) -> VectorizedBalanceLogCalculator:
+        if not isinstance(events, EventTable):
+            events = EventTable.from_events(events, with_descriptions)
+        descriptions = events.descriptions if with_descriptions else None
+        return cls(events.dates, events.impacts, descriptions)
+
+    def get_balance_log(self, initial: Balance) -> BalanceSeries:
+        first = np.searchsorted(self.__dates, np.datetime64(initial.date, "D"), side="left")
+        dates = np.concatenate(([np.datetime64(initial.date, "D")], self.__dates[first:]))
+        running = np.cumsum(np.concatenate(([initial.value], self.__impacts[first:])))
+        # Last position of every date group holds the balance at the end of that day
+        group_ends = np.append(np.flatnonzero(dates[1:] != dates[:-1]), len(dates) - 1)
+        group_starts = np.concatenate(([0], group_ends[:-1] + 1))
+        if self.__descriptions is None:
+            return BalanceSeries(dates=dates[group_ends], values=running[group_ends])
+        parts = np.concatenate(([initial.description], self.__descriptions[first:]))
+        return BalanceSeries(
+            dates=dates[group_ends],
+            values=running[group_ends],
+            description_parts=parts,
+            description_offsets=np.append(group_starts, len(dates)),
+        )
+
+    def get_daily_balances(
+        self, initial: Balance, end_date: datetime.date, out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Return the end-of-day balance for every day from initial.date to end_date.
+
+        Item i holds the balance at initial.date + i days. Values are the same as in get_balance_log,
+        and out, if given, must have one item per day.
+        """
+        start, end = np.datetime64(initial.date, "D"), np.datetime64(end_date, "D")
+        if end < start:
+            raise CalculatorError("end_date is before initial balance date")
+        first = np.searchsorted(self.__dates, start, side="left")
+        last = np.searchsorted(self.__dates, end, side="right")
+        running = np.cumsum(np.concatenate(([initial.value], self.__impacts[first:last])))
+        event_counts = np.searchsorted(self.__dates[first:last], np.arange(start, end + 1), side="right")
+        return np.take(running, event_counts, out=out)
+
+    def save_daily_balances(self, path: str, initial: Balance, end_date: datetime.date) -> np.memmap:
+        """Write get_daily_balances straight into a memory-mapped .npy file and return the mapping.
+
+        Other processes can open the file with np.load(path, mmap_mode="r") without copying it.
+        """
+        n_days = (end_date - initial.date).days + 1
+        if n_days < 1:
+            raise CalculatorError("end_date is before initial balance date")
+        dtype = np.result_type(np.asarray(initial.value), self.__impacts)
+        daily_balances = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n_days,))
+        self.get_daily_balances(initial, end_date, out=daily_balances)
+        daily_balances.flush()
+        return daily_balances
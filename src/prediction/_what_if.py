@@ -0,0 +1,82 @@
+from __future__ import annotations
+from typing import Callable, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .types import Event, ScenarioConfiguration
+from ._event_table import EventTable
+
+
+class WhatIfSweep:
+    """Evaluates grids of start balance offsets and per-category event scales from one base forecast.
+
+    The balance is linear in the start balance and in every event value, so the daily balance
+    for scales s is start_balance + s @ C, where row c of C holds the cumulative daily impact
+    of category c. Events are grouped into categories by description, or by category_of(description).
+    """
+
+    def __init__(
+        self,
+        events: Iterable[Event],
+        config: ScenarioConfiguration,
+        start_balance: float,
+        category_of: Optional[Callable[[str], str]] = None,
+    ) -> None:
+        if not isinstance(events, EventTable) or events.descriptions is None:
+            events = EventTable.from_events(events)
+        start, end = np.datetime64(config.start_date, "D"), np.datetime64(config.end_date, "D")
+        in_scenario = (start <= events.dates) & (events.dates <= end)
+        descriptions = events.descriptions[in_scenario]
+        if category_of is not None:
+            descriptions = np.array([category_of(d) for d in descriptions], dtype=object)
+        categories, category_indices = np.unique(descriptions.astype(str), return_inverse=True)
+        n_days = (end - start).astype(np.int64) + 1
+        days = (events.dates[in_scenario] - start).astype(np.int64)
+        daily_impacts = np.bincount(
+            category_indices * n_days + days,
+            weights=events.impacts[in_scenario].astype(np.float64),
+            minlength=len(categories) * n_days,
+        )
+        self.__categories = tuple(str(c) for c in categories)
+        self.__dates = np.arange(start, end + 1)
+        self.__start_balance = start_balance
+        self.__cumulative_impacts = np.cumsum(daily_impacts.reshape(len(categories), n_days), axis=1)
+
+    @property
+    def categories(self) -> Tuple[str, ...]:
+        return self.__categories
+
+    @property
+    def dates(self) -> np.ndarray:
+        return self.__dates
+
+    def scale_vector(self, scales: Mapping[str, float]) -> np.ndarray:
+        """Return scales for every category, 1 for the ones not given."""
+        unknown = set(scales) - set(self.__categories)
+        if unknown:
+            raise ValueError(f"Unknown categories: {sorted(unknown)}")
+        return np.array([scales.get(c, 1.0) for c in self.__categories])
+
+    def evaluate(self, start_balance_offsets: Sequence[float], scales: np.ndarray) -> np.ndarray:
+        """Return daily balances with shape (len(start_balance_offsets), len(scales), len(dates)).
+
+        scales has one row per scenario and one column per category.
+        """
+        offsets, scales = self.__check_grid(start_balance_offsets, scales)
+        base = self.__start_balance + scales @ self.__cumulative_impacts
+        return offsets[:, np.newaxis, np.newaxis] + base[np.newaxis, :, :]
+
+    def min_balances(self, start_balance_offsets: Sequence[float], scales: np.ndarray) -> np.ndarray:
+        """Return the lowest balance of every grid point, shape (len(start_balance_offsets), len(scales))."""
+        offsets, scales = self.__check_grid(start_balance_offsets, scales)
+        base = self.__start_balance + scales @ self.__cumulative_impacts
+        return offsets[:, np.newaxis] + base.min(axis=1)[np.newaxis, :]
+
+    def __check_grid(self, start_balance_offsets: Sequence[float], scales: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        offsets = np.asarray(start_balance_offsets, dtype=np.float64)
+        scales = np.atleast_2d(np.asarray(scales, dtype=np.float64))
+        if offsets.ndim != 1:
+            raise ValueError("start_balance_offsets must be one-dimensional")
+        if scales.ndim != 2 or scales.shape[1] != len(self.__categories):
+            raise ValueError(f"scales must have one column per category ({len(self.__categories)})")
+        return offsets, scales
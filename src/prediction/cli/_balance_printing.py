@@ -1,17 +1,24 @@
 from typing import List
 
 from ..types import Balance
+from .._money import format_cents
 
 
 class BalanceLogPrinter:
-    def __init__(self, balance_log: List[Balance]) -> None:
+    def __init__(self, balance_log: List[Balance], cents: bool = False) -> None:
         self.__balance_log = balance_log
-        self.__value_length = max(len(str(b.value)) for b in self.__balance_log)
+        self.__cents = cents
+        self.__value_length = max(len(self.__format_value(b.value)) for b in self.__balance_log)
 
     def print_all(self) -> None:
         for balance in self.__balance_log:
             print(self.__get_one_line_balance(balance))
 
     def __get_one_line_balance(self, balance: Balance) -> str:
-        value_str = f"{balance.value:_.0f}"
+        value_str = self.__format_value(balance.value)
         return f"{balance.date} | {value_str.rjust(self.__value_length)} | {balance.description}"
+
+    def __format_value(self, value: float) -> str:
+        if self.__cents:
+            return format_cents(value)
+        return f"{value:_.0f}"
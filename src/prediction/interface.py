@@ -1,9 +1,17 @@
-from prediction.types import HistoryId, BalanceHistory
+from datetime import date
+from typing import Iterator, Optional
+
+from prediction.types import HistoryId, BalanceHistory, Balance
 
 
 class IBalanceRepo:
     def store_new_history(self, history: BalanceHistory) -> None:
         raise NotImplementedError()
 
-    def load_history(self, history_id: HistoryId) -> BalanceHistory:
+    def load_history(
+        self, history_id: HistoryId, start: Optional[date] = None, end: Optional[date] = None
+    ) -> BalanceHistory:
+        raise NotImplementedError()
+
+    def iter_history(self, history_id: HistoryId) -> Iterator[Balance]:
         raise NotImplementedError()
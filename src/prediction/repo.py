@@ -1,10 +1,21 @@
 import csv
 import dataclasses as dc
-from datetime import datetime
+import io
+from datetime import date, datetime, time
+from typing import Iterator, List, Optional, TextIO, Tuple, Union
 
 from pathlib import Path
+import numpy as np
+
 from prediction.types import Balance, BalanceHistory, HistoryId
 from prediction.interface import IBalanceRepo
+from prediction._helpers import to_naive_utc
+
+
+_ENCODING = "utf-8"
+# One entry per distinct date: the date, byte offset and index of its first row. The last entry
+# holds the file size and row count, so the rows of entries i..j-1 span offset[i]..offset[j].
+_INDEX_DTYPE = np.dtype([("date", "datetime64[us]"), ("offset", np.int64), ("row", np.int64)])
 
 
 class BalanceRepoException(Exception):
@@ -32,30 +43,126 @@ class CsvBalanceRepo(IBalanceRepo):
 
     def __store_new_history(self, history: BalanceHistory) -> None:
         new_file_path = self.__id_to_path(history.id)
-        with open(new_file_path, "x") as file:
-            writer = csv.writer(file)
-            for balance in history.balances:
-                to_write = dc.astuple(balance)
-                writer.writerow(to_write)
+        index_path = self.__id_to_index_path(history.id)
+        file = open(new_file_path, "xb")
+        try:
+            with file:
+                rows, index = _encode_rows(history.balances)
+                # The index is written first, so a stored CSV always comes with its index
+                np.save(index_path, index)
+                file.writelines(rows)
+        except BaseException:
+            new_file_path.unlink(missing_ok=True)
+            index_path.unlink(missing_ok=True)
+            raise
 
-    def load_history(self, history_id: HistoryId) -> BalanceHistory:
+    def load_history(
+        self, history_id: HistoryId, start: Optional[date] = None, end: Optional[date] = None
+    ) -> BalanceHistory:
+        """Load balances dated from start to end, inclusive; dates without time cover the whole day."""
         try:
-            return self.__load_history(history_id)
+            if start is None and end is None:
+                return self.__load_history(history_id)
+            return self.__load_history_range(history_id, start, end)
         except FileNotFoundError as err:
             raise UnknownIdError from err
 
     def __load_history(self, log_id: HistoryId) -> BalanceHistory:
         file_path = self.__id_to_path(log_id)
-        balances = []
-        with open(file_path) as file:
-            reader = csv.reader(file)
-            for row in reader:
-                description = row[0]
-                date = datetime.fromisoformat(row[1])
-                value = int(row[2])
-                balances.append(Balance(description, date, value))
+        with open(file_path, encoding=_ENCODING) as file:
+            balances = list(self.__iter_balances(file))
+        return BalanceHistory(log_id, balances)
+
+    def __load_history_range(self, log_id: HistoryId, start: Optional[date], end: Optional[date]) -> BalanceHistory:
+        start = None if start is None else _to_datetime(start, time.min)
+        end = None if end is None else _to_datetime(end, time.max)
+        file_path = self.__id_to_path(log_id)
+        index_path = self.__id_to_index_path(log_id)
+        if not index_path.exists():
+            # Histories stored before the index existed are filtered after a full load
+            balances = self.__load_history(log_id).balances
+            in_range = [b for b in balances if (start is None or start <= b.date) and (end is None or b.date <= end)]
+            return BalanceHistory(log_id, in_range)
+        index = np.load(index_path, mmap_mode="r")
+        dates = index["date"][:-1]
+        first = 0 if start is None else np.searchsorted(dates, _to_index_date(start), side="left")
+        last = len(dates) if end is None else np.searchsorted(dates, _to_index_date(end), side="right")
+        # start after end selects nothing, as in the full load fallback
+        last = max(last, first)
+        with open(file_path, "rb") as file:
+            file.seek(index["offset"][first])
+            data = file.read(index["offset"][last] - index["offset"][first])
+        with io.StringIO(data.decode(_ENCODING)) as rows:
+            balances = list(self.__iter_balances(rows))
         return BalanceHistory(log_id, balances)
 
+    def iter_history(self, history_id: HistoryId) -> Iterator[Balance]:
+        """Read balances one by one; the file is opened on first use and closed with the iterator."""
+        file_path = self.__id_to_path(history_id)
+        if not file_path.exists():
+            raise UnknownIdError(history_id.value)
+        return self.__iter_file(file_path)
+
+    def __iter_file(self, file_path: Path) -> Iterator[Balance]:
+        try:
+            file = open(file_path, encoding=_ENCODING)
+        except FileNotFoundError as err:
+            raise UnknownIdError from err
+        with file:
+            yield from self.__iter_balances(file)
+
+    def __iter_balances(self, file: TextIO) -> Iterator[Balance]:
+        for row in csv.reader(file):
+            yield _row_to_balance(row)
+
     def __id_to_path(self, history_id: HistoryId) -> Path:
         file_name = history_id.value + ".csv"
         return self.__path / file_name
+
+    def __id_to_index_path(self, history_id: HistoryId) -> Path:
+        file_name = history_id.value + ".index.npy"
+        return self.__path / file_name
+
+
+def _encode_rows(balances: List[Balance]) -> Tuple[List[bytes], np.ndarray]:
+    rows = []
+    index = []
+    row = io.StringIO()
+    writer = csv.writer(row)
+    offset = 0
+    for row_number, balance in enumerate(balances):
+        if not index or index[-1][0] != balance.date:
+            index.append((balance.date, offset, row_number))
+        writer.writerow(dc.astuple(balance))
+        rows.append(row.getvalue().encode(_ENCODING))
+        offset += len(rows[-1])
+        row.seek(0)
+        row.truncate()
+    entries = [(_to_index_date(d), entry_offset, row_number) for d, entry_offset, row_number in index]
+    entries.append((np.datetime64("NaT"), offset, len(balances)))
+    return rows, np.array(entries, dtype=_INDEX_DTYPE)
+
+
+def _to_index_date(value: date) -> np.datetime64:
+    return np.datetime64(to_naive_utc(value), "us")
+
+
+def _to_datetime(value: date, time_of_day: time) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time_of_day)
+
+
+def _row_to_balance(row: List[str]) -> Balance:
+    description = row[0]
+    date = datetime.fromisoformat(row[1])
+    value = _parse_value(row[2])
+    return Balance(description, date, value)
+
+
+def _parse_value(text: str) -> Union[int, float]:
+    # Integer values, e.g. amounts in cents, are read back exactly
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
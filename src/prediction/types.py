@@ -7,7 +7,7 @@ import datetime
 from .errors import ValidationError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventData:
     description: str
     value: float
@@ -15,7 +15,7 @@ class EventData:
     paid: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonthlyEventData:
     description: str
     value: float
@@ -43,7 +43,7 @@ class EventsDataPaths:
     paths: Tuple[str]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     description: str
     date: datetime.date
@@ -66,7 +66,7 @@ class HistoryId:
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Balance:
     description: str
     date: datetime.date
@@ -80,7 +80,23 @@ class Comparition:
     diffs: List[Difference]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Difference:
     date: datetime.date
     value: float
+
+
+@dataclass(frozen=True, slots=True)
+class DifferenceRun:
+    start_date: datetime.date
+    end_date: datetime.date
+    value: float
+
+
+@dataclass(frozen=True)
+class RunLengthComparition:
+    base_id: HistoryId
+    compared_id: HistoryId
+    runs: List[DifferenceRun]
+    max_abs_diff: Optional[float]
+    first_divergence_date: Optional[datetime.date]
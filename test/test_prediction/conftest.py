@@ -1,9 +1,30 @@
 import pytest
+import datetime
 import os
 
+from prediction import DataSourcesConfiguration, EventsDataPaths, ScenarioConfiguration
+
 
 @pytest.fixture
 def example_data_folder_path() -> str:
     this_folder_path = os.path.dirname(os.path.abspath(__file__))
     example_data_folder_name = "example_data"
     return os.path.join(this_folder_path, example_data_folder_name)
+
+
+@pytest.fixture
+def data_config(example_data_folder_path: str) -> DataSourcesConfiguration:
+    def paths(*names: str) -> EventsDataPaths:
+        return EventsDataPaths(tuple(os.path.join(example_data_folder_path, n) for n in names))
+
+    return DataSourcesConfiguration(
+        monthly_spending_paths=paths("first_of_the_month_event.csv", "infinite_event.csv"),
+        one_time_spending_paths=paths("one_time_event.csv", "paid_events.csv"),
+        monthly_income_paths=paths("first_of_the_month_event.csv"),
+        one_time_income_paths=paths("one_time_event.csv"),
+    )
+
+
+@pytest.fixture
+def scenario_config() -> ScenarioConfiguration:
+    return ScenarioConfiguration(start_date=datetime.date(1999, 12, 1), end_date=datetime.date(2023, 3, 1))
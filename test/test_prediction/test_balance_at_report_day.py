@@ -1,7 +1,15 @@
 import pytest
 import datetime
 
-from prediction import ReportDay, BalanceLogCalulator, Event, errors, Balance
+from prediction import (
+    ReportDay,
+    ReportDaySampler,
+    BalanceLogCalulator,
+    VectorizedBalanceLogCalculator,
+    Event,
+    errors,
+    Balance,
+)
 
 
 def test_givenBalanceLogEmpty_whenBalanceAtReportDay_thenRaise():
@@ -199,3 +207,37 @@ def test_whenMultipleReportDays():
     # assert final_balance.date == datetime.date(2022, 7, 25)
     # assert final_balance.value == -1_000
     # assert len(balance_log) == 5
+
+
+def test_givenLastMonthDay_whenNoEventsInMonths_thenLastDayOfEachMonth():
+    calculator = BalanceLogCalulator(
+        [
+            Event(description="A", date=datetime.date(2023, 4, 30), balance_impact=-100),
+        ]
+    )
+    initial_balance = Balance(description="Initial balance", date=datetime.date(2023, 1, 31), value=111)
+    calculator.get_balance_log(initial_balance)
+
+    balance_log = calculator.get_balance_at_report_day(ReportDay(month_day=-1, description="Month end"))
+
+    assert [(b.date, b.value) for b in balance_log] == [
+        (datetime.date(2023, 1, 31), 111),
+        (datetime.date(2023, 2, 28), 111),
+        (datetime.date(2023, 3, 31), 111),
+        (datetime.date(2023, 4, 30), 11),
+    ]
+
+
+def test_sampler_accepts_balance_series():
+    events = [
+        Event(description="A", date=datetime.date(2022, 3, 22), balance_impact=-111),
+        Event(description="B", date=datetime.date(2022, 4, 11), balance_impact=1_000),
+        Event(description="C", date=datetime.date(2022, 8, 25), balance_impact=2_000),
+    ]
+    initial_balance = Balance(description="Initial balance", date=datetime.date(2022, 3, 12), value=111)
+    report_days = (ReportDay(month_day=25, description="25"), ReportDay(month_day=1, description="1"))
+    calculator = BalanceLogCalulator(events)
+    calculator.get_balance_log(initial_balance)
+    series = VectorizedBalanceLogCalculator.from_events(events).get_balance_log(initial_balance)
+
+    assert ReportDaySampler(series).sample(*report_days) == calculator.get_balance_at_report_day(*report_days)
@@ -0,0 +1,61 @@
+import pytest
+import datetime
+
+import numpy as np
+
+from prediction import BalanceIndex, BalanceLogCalulator, VectorizedBalanceLogCalculator, Balance, Event, errors
+
+
+@pytest.fixture
+def events():
+    return [
+        Event(description="A", date=datetime.date(2022, 3, 22), balance_impact=-111),
+        Event(description="B", date=datetime.date(2022, 4, 11), balance_impact=1_000),
+        Event(description="C", date=datetime.date(2022, 4, 11), balance_impact=-300),
+        Event(description="D", date=datetime.date(2022, 8, 25), balance_impact=2_000),
+    ]
+
+
+@pytest.fixture
+def initial_balance() -> Balance:
+    return Balance(description="Initial balance", date=datetime.date(2022, 3, 12), value=111)
+
+
+@pytest.mark.parametrize(
+    "date, expected",
+    (
+        (datetime.date(2022, 3, 12), 111),
+        (datetime.date(2022, 3, 21), 111),
+        (datetime.date(2022, 3, 22), 0),
+        (datetime.date(2022, 4, 11), 700),
+        (datetime.date(2022, 8, 24), 700),
+        (datetime.date(2030, 1, 1), 2_700),
+    )
+)
+def test_balance_at(events, initial_balance: Balance, date: datetime.date, expected: float):
+    index = BalanceIndex(BalanceLogCalulator(events).get_balance_log(initial_balance))
+
+    assert index.balance_at(date) == expected
+
+
+def test_balances_at_matches_for_list_and_series(events, initial_balance: Balance):
+    dates = [initial_balance.date + datetime.timedelta(days=d) for d in range(0, 200, 7)]
+    from_list = BalanceIndex(BalanceLogCalulator(events).get_balance_log(initial_balance))
+    from_series = BalanceIndex(VectorizedBalanceLogCalculator.from_events(events).get_balance_log(initial_balance))
+
+    expected = np.array([from_list.balance_at(d) for d in dates])
+
+    assert np.array_equal(from_list.balances_at(dates), expected)
+    assert np.array_equal(from_series.balances_at(np.array(dates, dtype="datetime64[D]")), expected)
+
+
+def test_date_before_log_raise(events, initial_balance: Balance):
+    index = BalanceIndex(BalanceLogCalulator(events).get_balance_log(initial_balance))
+
+    with pytest.raises(errors.CalculatorError):
+        index.balance_at(datetime.date(2022, 3, 11))
+
+
+def test_empty_log_raise():
+    with pytest.raises(errors.CalculatorError):
+        BalanceIndex([])
@@ -73,3 +73,26 @@ def test_whenEventsSameDate_thenReduceBalanceCount():
     assert one_balance.date == intial_balance.date
     assert one_balance.value == 2
     assert one_balance.description == "I, A, B"
+
+
+def test_whenManyEventsSameDate_thenDescriptionsJoinedInOrder():
+    events = [Event(description=str(idx), date=datetime.date(2023, 4, 11), balance_impact=1) for idx in range(1_000)]
+    intial_balance = Balance(description="I", date=datetime.date(2023, 4, 10), value=0)
+
+    balance_log = BalanceLogCalulator(events).get_balance_log(intial_balance)
+
+    assert len(balance_log) == 2
+    assert balance_log[1].description == ", ".join(str(idx) for idx in range(1_000))
+    assert balance_log[1].value == 1_000
+
+
+def test_whenWithoutDescriptions_thenDescriptionsEmpty():
+    first_event = Event(description="A", date=datetime.date(2023, 4, 10), balance_impact=-1)
+    second_event = Event(description="B", date=datetime.date(2023, 4, 11), balance_impact=-2)
+    intial_balance = Balance(description="I", date=datetime.date(2023, 4, 10), value=5)
+    calculator = BalanceLogCalulator([first_event, second_event], with_descriptions=False)
+
+    balance_log = calculator.get_balance_log(intial_balance)
+
+    assert [b.description for b in balance_log] == ["", ""]
+    assert [b.value for b in balance_log] == [4, 2]
@@ -0,0 +1,89 @@
+import pytest
+import datetime
+import random
+from typing import List
+
+from prediction import (
+    BalanceRangeIndex,
+    BalanceIndex,
+    BalanceLogCalulator,
+    VectorizedBalanceLogCalculator,
+    Balance,
+    Event,
+    errors,
+)
+
+
+@pytest.fixture
+def events() -> List[Event]:
+    rng = random.Random(5)
+    origin = datetime.date(2022, 1, 1)
+    events = [
+        Event(description=str(idx), date=origin + datetime.timedelta(days=rng.randrange(365)),
+              balance_impact=rng.randrange(-300, 300))
+        for idx in range(150)
+    ]
+    events.sort(key=lambda e: e.date)
+    return events
+
+
+@pytest.fixture
+def initial_balance() -> Balance:
+    return Balance(description="Initial", date=datetime.date(2022, 1, 1), value=500)
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+def test_queries_match_daily_scan(events: List[Event], initial_balance: Balance, vectorized: bool):
+    balance_log = BalanceLogCalulator(events).get_balance_log(initial_balance)
+    if vectorized:
+        balance_series = VectorizedBalanceLogCalculator.from_events(events).get_balance_log(initial_balance)
+        range_index = BalanceRangeIndex(balance_series)
+    else:
+        range_index = BalanceRangeIndex(balance_log)
+    point_index = BalanceIndex(balance_log)
+    rng = random.Random(9)
+
+    for _ in range(50):
+        start = initial_balance.date + datetime.timedelta(days=rng.randrange(400))
+        end = start + datetime.timedelta(days=rng.randrange(100))
+        days = [start + datetime.timedelta(days=d) for d in range((end - start).days + 1)]
+        daily = [point_index.balance_at(d) for d in days]
+        assert range_index.min_balance(start, end) == min(daily)
+        assert range_index.max_balance(start, end) == max(daily)
+        assert range_index.argmin(start, end) == days[daily.index(min(daily))]
+        threshold = rng.randrange(-1_000, 1_000)
+        below = [d for d, value in zip(days, daily) if value < threshold]
+        first_below = range_index.first_below(threshold, start)
+        if below:
+            assert first_below == below[0]
+        else:
+            assert first_below is None or first_below > end
+
+
+def test_first_below_from_log_start(initial_balance: Balance):
+    events = [
+        Event(description="A", date=datetime.date(2022, 2, 1), balance_impact=-400),
+        Event(description="B", date=datetime.date(2022, 3, 1), balance_impact=300),
+        Event(description="C", date=datetime.date(2022, 4, 1), balance_impact=-450),
+    ]
+    range_index = BalanceRangeIndex(BalanceLogCalulator(events).get_balance_log(initial_balance))
+
+    assert range_index.first_below(200) == datetime.date(2022, 2, 1)
+    assert range_index.first_below(0) == datetime.date(2022, 4, 1)
+    assert range_index.first_below(-100) is None
+    assert range_index.argmin() == datetime.date(2022, 4, 1)
+    assert range_index.min_balance() == -50
+
+
+def test_range_before_log_raise(initial_balance: Balance):
+    range_index = BalanceRangeIndex([initial_balance])
+
+    with pytest.raises(errors.CalculatorError):
+        range_index.min_balance(datetime.date(2020, 1, 1), datetime.date(2020, 2, 1))
+
+
+def test_unsorted_log_raise(initial_balance: Balance):
+    earlier = Balance(description="Earlier", date=initial_balance.date - datetime.timedelta(days=1), value=0)
+
+    with pytest.raises(errors.CalculatorError):
+        BalanceRangeIndex([initial_balance, earlier])
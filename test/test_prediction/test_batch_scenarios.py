@@ -0,0 +1,50 @@
+import pytest
+import datetime
+from typing import List
+
+from prediction import (
+    EventGenerator,
+    DataSourcesConfiguration,
+    ScenarioConfiguration,
+    BalanceLogCalulator,
+    Balance,
+    MainCfg,
+    ReportDay,
+    get_balance_logs,
+)
+
+
+@pytest.fixture
+def configs() -> List[MainCfg]:
+    return [
+        MainCfg(start_balance=1_000, start_date=datetime.date(1999, 12, 1), end_date=datetime.date(2003, 1, 1)),
+        MainCfg(start_balance=-50, start_date=datetime.date(2022, 4, 1), end_date=datetime.date(2023, 1, 1)),
+        MainCfg(
+            start_balance=0,
+            start_date=datetime.date(2022, 1, 1),
+            end_date=datetime.date(2022, 12, 1),
+            report_days=[ReportDay(month_day=15, description="15")],
+        ),
+    ]
+
+
+def calculate_separately(data_config: DataSourcesConfiguration, config: MainCfg) -> List[Balance]:
+    events = EventGenerator(data_config).get_events(ScenarioConfiguration(config.start_date, config.end_date))
+    calculator = BalanceLogCalulator(events)
+    balance_log = calculator.get_balance_log(Balance("Initial", config.start_date, config.start_balance))
+    if config.report_days:
+        balance_log = calculator.get_balance_at_report_day(*config.report_days)
+    return balance_log
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_batch_matches_separate_runs(
+    data_config: DataSourcesConfiguration, configs: List[MainCfg], max_workers: int
+):
+    balance_logs = get_balance_logs(configs, EventGenerator(data_config), max_workers=max_workers)
+
+    assert balance_logs == [calculate_separately(data_config, c) for c in configs]
+
+
+def test_no_configs_no_logs(data_config: DataSourcesConfiguration):
+    assert get_balance_logs([], EventGenerator(data_config)) == []
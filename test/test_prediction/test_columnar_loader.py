@@ -0,0 +1,115 @@
+import pytest
+import datetime
+import os
+
+import numpy as np
+
+from prediction import (
+    EventsFileReader,
+    EventGenerator,
+    DataSourcesConfiguration,
+    EventsDataPaths,
+    ScenarioConfiguration,
+    EventData,
+    MonthlyEventData,
+    line_to_event,
+    line_to_monthly_event,
+    read_event_columns,
+    read_monthly_event_columns,
+    validate_event_columns,
+    validate_monthly_event_columns,
+    validate_monthly_event_data,
+    errors,
+)
+
+
+@pytest.mark.parametrize("file_name", ("one_time_event.csv", "paid_events.csv"))
+def test_event_columns_match_row_reader(example_data_folder_path: str, file_name: str):
+    file_path = os.path.join(example_data_folder_path, file_name)
+
+    columns = read_event_columns(file_path)
+
+    assert columns.date.dtype == np.dtype("datetime64[D]")
+    assert list(columns) == EventsFileReader[EventData](file_path, line_to_event).read()
+
+
+@pytest.mark.parametrize("file_name", ("first_of_the_month_event.csv", "infinite_event.csv"))
+def test_monthly_event_columns_match_row_reader(example_data_folder_path: str, file_name: str):
+    file_path = os.path.join(example_data_folder_path, file_name)
+
+    columns = read_monthly_event_columns(file_path)
+
+    assert columns.start_date.dtype == np.dtype("datetime64[D]")
+    assert list(columns) == EventsFileReader[MonthlyEventData](file_path, line_to_monthly_event).read()
+
+
+def test_not_padded_dates_are_parsed(tmp_path):
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; date\nA; 10; 2022.2.3\n")
+
+    columns = read_event_columns(str(file_path))
+
+    assert columns.row(0).date == datetime.date(2022, 2, 3)
+
+
+def test_invalid_date_raise(tmp_path):
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; date\nA; 10; 2022.02.30\n")
+
+    with pytest.raises(ValueError):
+        read_event_columns(str(file_path))
+
+
+def test_not_positive_value_raise_validation_error(tmp_path):
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; date\nA; 10; 2022.02.03\nB; -1; 2022.02.04\n")
+    columns = read_event_columns(str(file_path))
+
+    with pytest.raises(errors.ValidationError):
+        validate_event_columns(columns)
+
+
+@pytest.mark.parametrize("start_date, valid", (("2023.01.28", True), ("2023.01.29", False), ("2023.01.31", False)))
+def test_monthly_events_after_28th_raise_validation_error(tmp_path, start_date: str, valid: bool):
+    file_path = tmp_path / "monthly.csv"
+    file_path.write_text(f"description; value; start_date; end_date\nA; 10; {start_date}\n")
+    columns = read_monthly_event_columns(str(file_path))
+    rows = EventsFileReader[MonthlyEventData](str(file_path), line_to_monthly_event).read()
+
+    for validate, events in ((validate_monthly_event_columns, columns), (validate_monthly_event_data, rows[0])):
+        if valid:
+            validate(events)
+        else:
+            with pytest.raises(errors.ValidationError):
+                validate(events)
+
+
+def test_columnar_generator_matches_row_generator(example_data_folder_path: str):
+    def path(name: str) -> str:
+        return os.path.join(example_data_folder_path, name)
+
+    data_config = DataSourcesConfiguration(
+        monthly_spending_paths=EventsDataPaths((path("first_of_the_month_event.csv"),)),
+        one_time_spending_paths=EventsDataPaths((path("one_time_event.csv"), path("paid_events.csv"))),
+        monthly_income_paths=EventsDataPaths((path("infinite_event.csv"),)),
+        one_time_income_paths=EventsDataPaths((path("one_time_event.csv"),)),
+    )
+    scenario_config = ScenarioConfiguration(
+        start_date=datetime.date(1999, 8, 1),
+        end_date=datetime.date(2023, 12, 1),
+    )
+    row_generator = EventGenerator(config=data_config)
+    columnar_generator = EventGenerator(config=data_config, columnar=True)
+
+    assert columnar_generator.get_events(scenario_config) == row_generator.get_events(scenario_config)
+    assert columnar_generator.get_paid_events() == row_generator.get_paid_events()
+    assert columnar_generator.get_skipped_events() == row_generator.get_skipped_events()
+
+
+def test_file_without_events_gives_empty_columns(tmp_path):
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; start_date; end_date\n\n")
+
+    columns = read_monthly_event_columns(str(file_path))
+
+    assert len(columns) == 0
@@ -0,0 +1,59 @@
+import pytest
+import datetime
+import pickle
+
+from prediction import (
+    EventTable,
+    VectorizedBalanceLogCalculator,
+    Balance,
+    Event,
+    EventData,
+    MonthlyEventData,
+)
+from prediction.types import Difference
+
+
+@pytest.mark.parametrize(
+    "record",
+    (
+        Event(description="A", date=datetime.date(2022, 1, 1), balance_impact=1),
+        Balance(description="A", date=datetime.date(2022, 1, 1), value=1),
+        EventData(description="A", value=1, date=datetime.date(2022, 1, 1)),
+        MonthlyEventData(description="A", value=1, start_date=datetime.date(2022, 1, 1), end_date=None, month_day=1),
+        Difference(date=datetime.date(2022, 1, 1), value=1),
+    )
+)
+def test_core_types_are_slotted(record):
+    assert not hasattr(record, "__dict__")
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_event_table_behaves_like_event_list():
+    events = [
+        Event(description="A", date=datetime.date(2022, 1, 1), balance_impact=-1.5),
+        Event(description="B", date=datetime.date(2022, 1, 3), balance_impact=4),
+        Event(description="C", date=datetime.date(2022, 2, 1), balance_impact=10),
+    ]
+
+    table = EventTable.from_events(events)
+
+    assert len(table) == 3
+    assert table == events
+    assert table[-1] == events[-1]
+    assert table[1:] == events[1:]
+    assert list(table) == events
+    with pytest.raises(IndexError):
+        table[3]
+
+
+def test_calculator_from_table_matches_from_events():
+    events = [
+        Event(description="A", date=datetime.date(2022, 1, 1), balance_impact=-1.5),
+        Event(description="B", date=datetime.date(2022, 1, 1), balance_impact=4),
+    ]
+    initial_balance = Balance(description="I", date=datetime.date(2022, 1, 1), value=0)
+
+    from_table = VectorizedBalanceLogCalculator.from_events(EventTable.from_events(events))
+    from_list = VectorizedBalanceLogCalculator.from_events(events)
+
+    assert from_table.get_balance_log(initial_balance) == from_list.get_balance_log(initial_balance)
@@ -1,9 +1,14 @@
 import pytest
-from typing import List
-from datetime import date
+import random
+from typing import Iterator, List, Optional, Tuple
+from datetime import date, datetime, timedelta, timezone, tzinfo
 
-from prediction.types import BalanceHistory, HistoryId, Balance, Difference
-from prediction import HistoryComparator
+import numpy as np
+
+from prediction.types import BalanceHistory, HistoryId, Balance, Difference, DifferenceRun
+from prediction import HistoryComparator, MultiHistoryComparator, StreamingHistoryComparator
+from prediction.errors import ValidationError
+from prediction.repo import CsvBalanceRepo
 
 
 def test_compareEmpty_noDifferences():
@@ -267,3 +272,192 @@ def test_compare(
     for diff in desired:
         assert diff in result.diffs
     assert result.diffs == desired
+
+
+def reference_compare(base: List[Balance], compared: List[Balance]) -> List[Difference]:
+    first_date = max(base[0].date, compared[0].date)
+    dates = sorted({b.date for b in base + compared if b.date >= first_date})
+
+    def value_at(balances: List[Balance], day: date) -> float:
+        return [b for b in balances if b.date <= day][-1].value
+
+    return [Difference(d, value_at(compared, d) - value_at(base, d)) for d in dates]
+
+
+def random_balances(rng: random.Random, tz: Optional[tzinfo] = None) -> List[Balance]:
+    """Return balances on random days; with tz they are aware datetimes at random hours."""
+    days = sorted(rng.sample(range(200), rng.randint(1, 40)))
+    if tz is None:
+        dates = [date(2022, 1, 1) + timedelta(days=d) for d in days]
+    else:
+        dates = [datetime(2022, 1, 1, rng.randrange(24), tzinfo=tz) + timedelta(days=d) for d in days]
+    return [Balance("", d, rng.randint(-1_000, 1_000)) for d in dates]
+
+
+TIME_ZONES = (None, timezone(timedelta(hours=2)), timezone(timedelta(hours=-5)))
+
+
+@pytest.mark.filterwarnings("error")
+@pytest.mark.parametrize("tz", TIME_ZONES)
+@pytest.mark.parametrize("seed", range(20))
+def test_compare_random_histories(seed: int, tz: Optional[tzinfo]):
+    rng = random.Random(seed)
+    base_balances, compared_balances = random_balances(rng, tz), random_balances(rng, tz)
+    history_id = HistoryId("random")
+
+    result = HistoryComparator(
+        BalanceHistory(history_id, base_balances), BalanceHistory(history_id, compared_balances)
+    ).compare()
+
+    assert result.diffs == reference_compare(base_balances, compared_balances)
+    assert all(getattr(d.date, "tzinfo", None) is tz for d in result.diffs)
+
+
+def test_multi_comparator_matches_pairwise():
+    rng = random.Random(7)
+    base = BalanceHistory(HistoryId("base"), random_balances(rng))
+    histories = [BalanceHistory(HistoryId(f"h{idx}"), random_balances(rng)) for idx in range(10)]
+    histories.append(BalanceHistory(HistoryId("empty"), []))
+
+    result = MultiHistoryComparator(base, histories).compare()
+
+    assert result == [HistoryComparator(base, history).compare() for history in histories]
+
+
+def test_diff_matrix():
+    base = BalanceHistory(HistoryId("base"), [Balance("", date(2022, 1, 2), 10), Balance("", date(2022, 1, 4), 20)])
+    first = BalanceHistory(HistoryId("first"), [Balance("", date(2022, 1, 1), 5)])
+    second = BalanceHistory(HistoryId("second"), [Balance("", date(2022, 1, 3), 30), Balance("", date(2022, 1, 5), 0)])
+
+    dates, matrix = MultiHistoryComparator(base, [first, second]).diff_matrix()
+
+    assert dates.tolist() == [date(2022, 1, day) for day in range(1, 6)]
+    np.testing.assert_array_equal(
+        matrix,
+        [[np.nan, np.nan], [-5, np.nan], [-5, 20], [-15, 10], [-15, -20]],
+    )
+
+
+@pytest.mark.parametrize("tz", TIME_ZONES)
+@pytest.mark.parametrize("seed", range(20))
+def test_streaming_comparator_matches_comparator(seed: int, tz: Optional[tzinfo]):
+    rng = random.Random(seed)
+    base_balances, compared_balances = random_balances(rng, tz), random_balances(rng, tz)
+    history_id = HistoryId("random")
+    expected = HistoryComparator(
+        BalanceHistory(history_id, base_balances), BalanceHistory(history_id, compared_balances)
+    ).compare()
+
+    result = StreamingHistoryComparator(iter(base_balances), iter(compared_balances)).compare()
+
+    assert isinstance(result, Iterator)
+    assert list(result) == expected.diffs
+
+
+def test_streaming_comparator_with_empty_input():
+    assert list(StreamingHistoryComparator([], [Balance("", date(2022, 1, 1), 1)]).compare()) == []
+
+
+def test_streaming_comparator_descending_dates_raise():
+    descending = [Balance("", date(2022, 1, 2), 1), Balance("", date(2022, 1, 1), 1)]
+
+    with pytest.raises(ValidationError):
+        list(StreamingHistoryComparator(descending, descending).compare())
+
+
+def test_run_length_comparition():
+    base = BalanceHistory(HistoryId("base"), [Balance("", date(2022, 1, day), 10) for day in range(1, 8)])
+    compared = BalanceHistory(
+        HistoryId("compared"),
+        [
+            Balance("", date(2022, 1, 1), 10),
+            Balance("", date(2022, 1, 3), 15),
+            Balance("", date(2022, 1, 6), 2),
+        ],
+    )
+
+    result = HistoryComparator(base, compared).compare(run_length=True)
+
+    assert result.runs == [
+        DifferenceRun(date(2022, 1, 1), date(2022, 1, 2), 0),
+        DifferenceRun(date(2022, 1, 3), date(2022, 1, 5), 5),
+        DifferenceRun(date(2022, 1, 6), date(2022, 1, 7), -8),
+    ]
+    assert result.max_abs_diff == 8
+    assert result.first_divergence_date == date(2022, 1, 3)
+    assert (result.base_id, result.compared_id) == (base.id, compared.id)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_run_length_expands_to_comparition(seed: int):
+    rng = random.Random(seed)
+    base = BalanceHistory(HistoryId("base"), random_balances(rng))
+    compared = BalanceHistory(HistoryId("compared"), random_balances(rng))
+    comparitions = MultiHistoryComparator(base, [compared]).compare()
+    diffs = comparitions[0].diffs
+
+    result = MultiHistoryComparator(base, [compared]).compare(run_length=True)[0]
+
+    expanded = [
+        Difference(d.date, next(r.value for r in result.runs if r.start_date <= d.date <= r.end_date)) for d in diffs
+    ]
+    assert expanded == diffs
+    assert result.max_abs_diff == max(abs(d.value) for d in diffs)
+    assert result.first_divergence_date == next((d.date for d in diffs if d.value != 0), None)
+
+
+def test_run_length_of_empty_history():
+    result = HistoryComparator(BalanceHistory(HistoryId("a"), []), BalanceHistory(HistoryId("b"), [])).compare(True)
+
+    assert result.runs == []
+    assert result.max_abs_diff is None
+    assert result.first_divergence_date is None
+
+
+@pytest.fixture
+def repo_histories(tmp_path) -> Tuple[CsvBalanceRepo, BalanceHistory, BalanceHistory]:
+    repo = CsvBalanceRepo(tmp_path / "repo")
+    repo.store_new_history(
+        BalanceHistory(
+            HistoryId("base"),
+            [
+                Balance("", datetime(2022, 10, 1, 8), 100),
+                Balance("", datetime(2022, 10, 1, 18), 150),
+                Balance("", datetime(2022, 10, 3, 9), 120),
+            ],
+        )
+    )
+    repo.store_new_history(
+        BalanceHistory(
+            HistoryId("compared"),
+            [
+                Balance("", datetime(2022, 10, 1, 7), 90),
+                Balance("", datetime(2022, 10, 1, 12), 200),
+                Balance("", datetime(2022, 10, 3, 9, 30), 110.5),
+            ],
+        )
+    )
+    return repo, repo.load_history(HistoryId("base")), repo.load_history(HistoryId("compared"))
+
+
+def test_compare_histories_loaded_from_repo(repo_histories):
+    _, base, compared = repo_histories
+
+    result = HistoryComparator(base, compared).compare()
+
+    assert result.diffs == reference_compare(base.balances, compared.balances)
+    assert result.diffs == [
+        Difference(datetime(2022, 10, 1, 8), -10),
+        Difference(datetime(2022, 10, 1, 12), 100),
+        Difference(datetime(2022, 10, 1, 18), 50),
+        Difference(datetime(2022, 10, 3, 9), 80),
+        Difference(datetime(2022, 10, 3, 9, 30), -9.5),
+    ]
+
+
+def test_streaming_comparator_matches_comparator_on_repo_histories(repo_histories):
+    repo, base, compared = repo_histories
+
+    result = StreamingHistoryComparator(repo.iter_history(base.id), repo.iter_history(compared.id)).compare()
+
+    assert list(result) == HistoryComparator(base, compared).compare().diffs
@@ -1,7 +1,9 @@
 import pytest
 from typing import List
-from datetime import datetime
+from datetime import date, datetime, time, timedelta, timezone
 from pathlib import Path
+
+import numpy as np
 from prediction.repo import CsvBalanceRepo, IBalanceRepo, HistoryId, BalanceHistory, DuplicateIdError, UnknownIdError
 from prediction import Balance
 
@@ -60,3 +62,130 @@ def test_storeStore_raise(repo: IBalanceRepo, example_log: BalanceHistory):
 def test_load_raise(repo: IBalanceRepo):
     with pytest.raises(UnknownIdError):
         repo.load_history(HistoryId("whatever"))
+
+
+def test_iter_history(repo: IBalanceRepo, example_log: BalanceHistory):
+    repo.store_new_history(example_log)
+
+    balances = repo.iter_history(example_log.id)
+
+    assert list(balances) == example_log.balances
+
+
+def test_iter_unknown_history_raise(repo: IBalanceRepo):
+    with pytest.raises(UnknownIdError):
+        repo.iter_history(HistoryId("whatever"))
+
+
+@pytest.fixture
+def daily_history() -> BalanceHistory:
+    balances = [
+        Balance(f"day {day}, part {part}", datetime(2022, 1, day, 8 + part), day * 10 + part)
+        for day in range(1, 31)
+        for part in range(2)
+    ]
+    return BalanceHistory(HistoryId("daily"), balances)
+
+
+def bound(value, default: datetime, time_of_day: time) -> datetime:
+    if value is None:
+        return default
+    if isinstance(value, datetime):
+        return value
+    return datetime.combine(value, time_of_day)
+
+
+@pytest.mark.parametrize(
+    "start, end",
+    (
+        (datetime(2022, 1, 5), datetime(2022, 1, 9)),
+        (date(2022, 1, 5), date(2022, 1, 9)),
+        (datetime(2022, 1, 5, 9), datetime(2022, 1, 9, 8)),
+        (None, date(2022, 1, 3)),
+        (date(2022, 1, 28), None),
+        (date(2021, 1, 1), date(2021, 12, 31)),
+        (date(2023, 1, 1), None),
+    ),
+)
+def test_load_history_range(repo: IBalanceRepo, daily_history: BalanceHistory, start, end):
+    repo.store_new_history(daily_history)
+    lower = bound(start, datetime.min, time.min)
+    upper = bound(end, datetime.max, time.max)
+
+    history = repo.load_history(daily_history.id, start, end)
+
+    assert history.id == daily_history.id
+    assert history.balances == [b for b in daily_history.balances if lower <= b.date <= upper]
+
+
+def test_index_holds_row_count_and_date_range(
+    repo_path: Path, repo: IBalanceRepo, daily_history: BalanceHistory
+):
+    repo.store_new_history(daily_history)
+
+    index = np.load(repo_path / "daily.index.npy")
+
+    assert index["row"][-1] == len(daily_history.balances)
+    assert index["offset"][-1] == (repo_path / "daily.csv").stat().st_size
+    assert index["date"][0] == np.datetime64(daily_history.balances[0].date)
+    assert index["date"][-2] == np.datetime64(daily_history.balances[-1].date)
+
+
+def test_load_range_without_index(repo_path: Path, repo: IBalanceRepo, daily_history: BalanceHistory):
+    repo.store_new_history(daily_history)
+    (repo_path / "daily.index.npy").unlink()
+
+    history = repo.load_history(daily_history.id, date(2022, 1, 2), date(2022, 1, 2))
+
+    assert history.balances == daily_history.balances[2:4]
+
+
+@pytest.mark.parametrize("indexed", (True, False))
+def test_load_range_with_start_after_end_is_empty(
+    repo_path: Path, repo: IBalanceRepo, daily_history: BalanceHistory, indexed: bool
+):
+    repo.store_new_history(daily_history)
+    if not indexed:
+        (repo_path / "daily.index.npy").unlink()
+
+    history = repo.load_history(daily_history.id, date(2022, 1, 9), date(2022, 1, 5))
+
+    assert history.balances == []
+
+
+def test_load_range_of_unknown_history_raise(repo: IBalanceRepo):
+    with pytest.raises(UnknownIdError):
+        repo.load_history(HistoryId("whatever"), date(2022, 1, 1), date(2022, 1, 2))
+
+
+def test_iter_history_opens_file_lazily(repo_path: Path, repo: IBalanceRepo, example_log: BalanceHistory):
+    repo.store_new_history(example_log)
+    balances = repo.iter_history(example_log.id)
+    (repo_path / (example_log.id.value + ".csv")).unlink()
+
+    with pytest.raises(UnknownIdError):
+        next(balances)
+
+
+@pytest.mark.filterwarnings("error")
+def test_load_range_of_timezone_aware_history(repo_path: Path, repo: IBalanceRepo):
+    warsaw = timezone(timedelta(hours=2))
+    balances = [Balance(str(hour), datetime(2022, 6, 1, hour, tzinfo=warsaw), hour) for hour in range(0, 24, 4)]
+    history = BalanceHistory(HistoryId("aware"), balances)
+    repo.store_new_history(history)
+
+    loaded = repo.load_history(
+        history.id, datetime(2022, 5, 31, 23, tzinfo=timezone.utc), datetime(2022, 6, 1, 6, tzinfo=timezone.utc)
+    )
+
+    assert (repo_path / "aware.index.npy").exists()
+    assert loaded.balances == balances[1:3]
+
+
+def test_failed_store_leaves_no_files(repo_path: Path, repo: IBalanceRepo):
+    history = BalanceHistory(HistoryId("broken"), [Balance("", "not a date", 1)])
+
+    with pytest.raises(ValueError):
+        repo.store_new_history(history)
+
+    assert list(repo_path.iterdir()) == []
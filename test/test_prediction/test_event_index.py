@@ -0,0 +1,77 @@
+import pytest
+import datetime
+import os
+import random
+from pathlib import Path
+
+from prediction import EventGenerator, DataSourcesConfiguration, EventsDataPaths, ScenarioConfiguration
+from prediction._event_index import IntervalTree
+
+
+_WINDOWS = (
+    (datetime.date(1999, 1, 3), datetime.date(1999, 1, 5)),
+    (datetime.date(2000, 1, 2), datetime.date(2000, 1, 2)),
+    (datetime.date(1981, 1, 2), datetime.date(2100, 1, 2)),
+    (datetime.date(2022, 1, 1), datetime.date(2022, 12, 30)),
+    (datetime.date(2023, 1, 1), datetime.date(2023, 1, 1)),
+)
+
+
+@pytest.mark.parametrize("window", _WINDOWS)
+def test_indexed_matches_file_based(data_config: DataSourcesConfiguration, window):
+    scenario_config = ScenarioConfiguration(*window)
+    file_based = EventGenerator(data_config)
+    indexed = EventGenerator(data_config, indexed=True)
+    indexed.get_events(ScenarioConfiguration(datetime.date(1990, 1, 1), datetime.date(1991, 1, 1)))
+
+    assert indexed.get_events(scenario_config) == file_based.get_events(scenario_config)
+    assert indexed.get_paid_events() == file_based.get_paid_events()
+    assert indexed.get_skipped_events() == file_based.get_skipped_events()
+    assert list(indexed.iter_events(scenario_config)) == file_based.get_events(scenario_config)
+
+
+@pytest.mark.parametrize("indexed", (False, True))
+def test_repeated_queries_do_not_duplicate(data_config: DataSourcesConfiguration, indexed: bool):
+    generator = EventGenerator(data_config, indexed=indexed)
+    scenario_config = ScenarioConfiguration(*_WINDOWS[0])
+
+    generator.get_events(scenario_config)
+    first_paid, first_skipped = generator.get_paid_events(), generator.get_skipped_events()
+    generator.get_events(scenario_config)
+
+    assert generator.get_paid_events() == first_paid
+    assert generator.get_skipped_events() == first_skipped
+
+
+def test_indexed_sources_are_read_once(tmp_path: Path):
+    file_path = tmp_path / "one_time.csv"
+    file_path.write_text("description; value; date\nA; 10; 2022.02.03\n")
+    data_config = DataSourcesConfiguration(
+        monthly_spending_paths=EventsDataPaths([]),
+        one_time_spending_paths=EventsDataPaths((str(file_path),)),
+        monthly_income_paths=EventsDataPaths([]),
+        one_time_income_paths=EventsDataPaths([]),
+    )
+    scenario_config = ScenarioConfiguration(datetime.date(2022, 1, 1), datetime.date(2022, 12, 31))
+    generator = EventGenerator(data_config, indexed=True)
+    generator.get_events(scenario_config)
+
+    os.remove(file_path)
+
+    assert [e.description for e in generator.get_events(scenario_config)] == ["A"]
+
+
+def test_interval_tree_matches_brute_force():
+    rng = random.Random(7)
+    origin = datetime.date(2000, 1, 1)
+    intervals = []
+    for idx in range(200):
+        start = origin + datetime.timedelta(days=rng.randrange(3_000))
+        intervals.append((start, start + datetime.timedelta(days=rng.randrange(400)), idx))
+    tree = IntervalTree(intervals)
+
+    for _ in range(100):
+        start = origin + datetime.timedelta(days=rng.randrange(3_500))
+        end = start + datetime.timedelta(days=rng.randrange(100))
+        expected = [idx for i_start, i_end, idx in intervals if i_start <= end and i_end >= start]
+        assert sorted(tree.query(start, end)) == expected
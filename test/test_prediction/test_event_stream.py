@@ -0,0 +1,73 @@
+import pytest
+import dataclasses
+from typing import Iterator
+
+import numpy as np
+
+from prediction import (
+    EventGenerator,
+    DataSourcesConfiguration,
+    EventsDataPaths,
+    ScenarioConfiguration,
+    BalanceLogCalulator,
+    Balance,
+)
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_stream_matches_sorted_events(
+    data_config: DataSourcesConfiguration, scenario_config: ScenarioConfiguration, columnar: bool
+):
+    sorted_generator = EventGenerator(data_config, columnar=columnar)
+    stream_generator = EventGenerator(data_config, columnar=columnar)
+
+    stream = stream_generator.iter_events(scenario_config)
+
+    assert isinstance(stream, Iterator)
+    assert list(stream) == sorted_generator.get_events(scenario_config)
+    assert stream_generator.get_paid_events() == sorted_generator.get_paid_events()
+    assert stream_generator.get_skipped_events() == sorted_generator.get_skipped_events()
+
+
+def test_calculator_consumes_stream(data_config: DataSourcesConfiguration, scenario_config: ScenarioConfiguration):
+    initial = Balance("Initial", scenario_config.start_date, 1_000)
+    expected = BalanceLogCalulator(EventGenerator(data_config).get_events(scenario_config)).get_balance_log(initial)
+
+    balance_log = BalanceLogCalulator(EventGenerator(data_config).iter_events(scenario_config)).get_balance_log(initial)
+
+    assert balance_log == expected
+
+
+@pytest.mark.parametrize("cents", (False, True))
+@pytest.mark.parametrize("columnar, indexed", ((False, False), (True, False), (False, True), (True, True)))
+def test_event_table_matches_sorted_events(
+    data_config: DataSourcesConfiguration,
+    scenario_config: ScenarioConfiguration,
+    columnar: bool,
+    indexed: bool,
+    cents: bool,
+):
+    sorted_generator = EventGenerator(data_config, columnar=columnar, cents=cents)
+    table_generator = EventGenerator(data_config, columnar=columnar, indexed=indexed, cents=cents)
+
+    table = table_generator.get_event_table(scenario_config)
+
+    assert list(table) == sorted_generator.get_events(scenario_config)
+    assert table.dates.dtype == np.dtype("datetime64[D]")
+    if cents:
+        assert table.impacts.dtype == np.int64
+    assert table_generator.get_paid_events() == sorted_generator.get_paid_events()
+    assert table_generator.get_skipped_events() == sorted_generator.get_skipped_events()
+
+
+@pytest.mark.parametrize("columnar, indexed", ((False, False), (True, False), (False, True), (True, True)))
+def test_event_table_keeps_cents_without_one_time_events(
+    data_config: DataSourcesConfiguration, scenario_config: ScenarioConfiguration, columnar: bool, indexed: bool
+):
+    no_paths = EventsDataPaths(())
+    config = dataclasses.replace(data_config, one_time_spending_paths=no_paths, one_time_income_paths=no_paths)
+
+    table = EventGenerator(config, columnar=columnar, indexed=indexed, cents=True).get_event_table(scenario_config)
+
+    assert len(table) > 0
+    assert table.impacts.dtype == np.int64
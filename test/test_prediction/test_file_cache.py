@@ -0,0 +1,157 @@
+import pytest
+import datetime
+import os
+from pathlib import Path
+
+from prediction import _file_cache
+
+from prediction import (
+    EventsFileReader,
+    EventGenerator,
+    EventData,
+    ParsedFileCache,
+    DataSourcesConfiguration,
+    EventsDataPaths,
+    ScenarioConfiguration,
+    line_to_event,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Path:
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def events_file(tmp_path: Path) -> Path:
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; date\nA; 10; 2022.02.03\nB; 20; 2022.03.04\n")
+    return file_path
+
+
+class CountingTransform:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, line: str) -> EventData:
+        self.calls += 1
+        return line_to_event(line)
+
+
+def test_unchangedFile_parsedOnce(cache_dir: Path, events_file: Path):
+    transform = CountingTransform()
+    cache = ParsedFileCache(str(cache_dir))
+
+    first = EventsFileReader[EventData](str(events_file), transform, cache=cache).read()
+    second = EventsFileReader[EventData](str(events_file), transform, cache=cache).read()
+
+    assert first == second
+    assert list(EventsFileReader[EventData](str(events_file), transform, cache=cache).iter()) == first
+    assert transform.calls == 2
+
+
+def test_changedFile_parsedAgain(cache_dir: Path, events_file: Path):
+    cache = ParsedFileCache(str(cache_dir))
+    reader = EventsFileReader[EventData](str(events_file), line_to_event, cache=cache)
+    reader.read()
+
+    events_file.write_text("description; value; date\nC; 30; 2022.04.05\n")
+    events = reader.read()
+
+    assert [e.description for e in events] == ["C"]
+
+
+def test_cacheAboveMaxSize_oldEntriesEvicted(cache_dir: Path, tmp_path: Path):
+    cache = ParsedFileCache(str(cache_dir), max_size=1)
+    for idx in range(3):
+        file_path = tmp_path / f"events_{idx}.csv"
+        file_path.write_text(f"description; value; date\nA{idx}; 10; 2022.02.03\n")
+        EventsFileReader[EventData](str(file_path), line_to_event, cache=cache).read()
+
+    assert len(os.listdir(cache_dir)) == 0
+
+
+def test_cacheBelowMaxSize_entriesKept(cache_dir: Path, events_file: Path):
+    cache = ParsedFileCache(str(cache_dir))
+    EventsFileReader[EventData](str(events_file), line_to_event, cache=cache).read()
+
+    assert len(os.listdir(cache_dir)) == 1
+    cache.clear()
+    assert len(os.listdir(cache_dir)) == 0
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_generatorWithCache_sameEvents(cache_dir: Path, example_data_folder_path: str, columnar: bool):
+    def paths(*names: str) -> EventsDataPaths:
+        return EventsDataPaths(tuple(os.path.join(example_data_folder_path, n) for n in names))
+
+    data_config = DataSourcesConfiguration(
+        monthly_spending_paths=paths("first_of_the_month_event.csv"),
+        one_time_spending_paths=paths("one_time_event.csv", "paid_events.csv"),
+        monthly_income_paths=paths("infinite_event.csv"),
+        one_time_income_paths=paths(),
+    )
+    scenario_config = ScenarioConfiguration(start_date=datetime.date(1999, 8, 1), end_date=datetime.date(2023, 12, 1))
+    cache = ParsedFileCache(str(cache_dir))
+    expected = EventGenerator(data_config, columnar=columnar).get_events(scenario_config)
+
+    cold = EventGenerator(data_config, columnar=columnar, cache=cache).get_events(scenario_config)
+    warm = EventGenerator(data_config, columnar=columnar, cache=cache).get_events(scenario_config)
+
+    assert cold == expected
+    assert warm == expected
+    assert len(os.listdir(cache_dir)) == 4
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_concurrentEviction_noErrors(cache_dir: Path, tmp_path: Path, columnar: bool):
+    paths = []
+    for idx in range(16):
+        file_path = tmp_path / f"events_{idx}.csv"
+        file_path.write_text(f"description; value; date\nA{idx}; 10; 2022.02.03\n")
+        paths.append(str(file_path))
+    no_paths = EventsDataPaths(())
+    data_config = DataSourcesConfiguration(no_paths, EventsDataPaths(tuple(paths)), no_paths, no_paths)
+    scenario_config = ScenarioConfiguration(start_date=datetime.date(2022, 1, 1), end_date=datetime.date(2022, 12, 1))
+    expected = EventGenerator(data_config, columnar=columnar).get_events(scenario_config)
+
+    for _ in range(20):
+        cache = ParsedFileCache(str(cache_dir), max_size=1)
+        generator = EventGenerator(data_config, columnar=columnar, max_workers=8, cache=cache)
+        assert generator.get_events(scenario_config) == expected
+
+
+def test_anonymousTransforms_notShared(cache_dir: Path, events_file: Path):
+    cache = ParsedFileCache(str(cache_dir))
+
+    values = EventsFileReader[float](str(events_file), lambda line: line_to_event(line).value, cache=cache).read()
+    doubled = EventsFileReader[float](str(events_file), lambda line: 2 * line_to_event(line).value, cache=cache).read()
+
+    assert values == [10, 20]
+    assert doubled == [20, 40]
+    assert len(os.listdir(cache_dir)) == 0
+
+
+def test_explicitCacheKind_cached(cache_dir: Path, events_file: Path):
+    cache = ParsedFileCache(str(cache_dir))
+    transform = CountingTransform()
+
+    for _ in range(2):
+        EventsFileReader[EventData](
+            str(events_file), lambda line: transform(line), cache=cache, cache_kind="counted_events"
+        ).read()
+
+    assert transform.calls == 2
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_formatVersionChange_entriesIgnored(cache_dir: Path, events_file: Path, monkeypatch):
+    transform = CountingTransform()
+    cache = ParsedFileCache(str(cache_dir))
+    EventsFileReader[EventData](str(events_file), transform, cache=cache).read()
+
+    monkeypatch.setattr(_file_cache, "_FORMAT_VERSION", _file_cache._FORMAT_VERSION + 1)
+    events = EventsFileReader[EventData](str(events_file), transform, cache=cache).read()
+
+    assert events == [EventData("A", 10, datetime.date(2022, 2, 3)), EventData("B", 20, datetime.date(2022, 3, 4))]
+    assert transform.calls == 4
@@ -0,0 +1,88 @@
+import pytest
+import datetime
+import random
+
+from prediction import IncrementalBalanceCalculator, BalanceIndex, BalanceLogCalulator, Balance, Event, errors
+
+
+@pytest.fixture
+def initial_balance() -> Balance:
+    return Balance(description="Initial balance", date=datetime.date(2022, 1, 1), value=1_000)
+
+
+def test_random_edits_match_full_recalculation(initial_balance: Balance):
+    rng = random.Random(11)
+    end_date = datetime.date(2031, 12, 31)
+    n_days = (end_date - initial_balance.date).days
+    calculator = IncrementalBalanceCalculator(initial_balance, end_date)
+    events = []
+    for idx in range(300):
+        if events and rng.random() < 0.3:
+            calculator.remove_event(events.pop(rng.randrange(len(events))))
+            continue
+        date = initial_balance.date + datetime.timedelta(days=rng.randrange(-30, n_days))
+        event = Event(description=str(idx), date=date, balance_impact=rng.randrange(-500, 500))
+        calculator.add_event(event)
+        events.append(event)
+
+    events.sort(key=lambda e: e.date)
+    expected_log = BalanceLogCalulator(events).get_balance_log(initial_balance)
+    expected = BalanceIndex(expected_log)
+    for _ in range(100):
+        date = initial_balance.date + datetime.timedelta(days=rng.randrange(n_days))
+        assert calculator.balance_at(date) == expected.balance_at(date)
+    assert calculator.get_balance_log() == expected_log
+
+
+def test_replace_event(initial_balance: Balance):
+    old = Event(description="rent", date=datetime.date(2022, 2, 1), balance_impact=-100)
+    new = Event(description="rent", date=datetime.date(2022, 3, 1), balance_impact=-150)
+    calculator = IncrementalBalanceCalculator(initial_balance, datetime.date(2022, 12, 31), [old])
+
+    calculator.replace_event(old, new)
+
+    assert calculator.balance_at(datetime.date(2022, 2, 15)) == 1_000
+    assert calculator.balance_at(datetime.date(2022, 3, 1)) == 850
+
+
+def test_remove_unknown_event_raise(initial_balance: Balance):
+    calculator = IncrementalBalanceCalculator(initial_balance, datetime.date(2022, 12, 31))
+
+    with pytest.raises(errors.CalculatorError):
+        calculator.remove_event(Event(description="A", date=datetime.date(2022, 2, 1), balance_impact=1))
+
+
+def test_event_after_end_date_raise(initial_balance: Balance):
+    calculator = IncrementalBalanceCalculator(initial_balance, datetime.date(2022, 12, 31))
+
+    with pytest.raises(errors.CalculatorError):
+        calculator.add_event(Event(description="A", date=datetime.date(2023, 1, 1), balance_impact=1))
+
+
+def test_removed_float_event_leaves_no_residue():
+    initial_balance = Balance(description="Initial balance", date=datetime.date(2022, 1, 1), value=0)
+    first = Event(description="first", date=datetime.date(2022, 1, 2), balance_impact=0.1)
+    second = Event(description="second", date=datetime.date(2022, 1, 2), balance_impact=0.2)
+    calculator = IncrementalBalanceCalculator(initial_balance, datetime.date(2022, 12, 31), [first, second])
+
+    calculator.remove_event(first)
+
+    assert calculator.balance_at(datetime.date(2022, 1, 2)) == 0.2
+    assert calculator.get_balance_log()[-1].value == 0.2
+
+
+def test_float_balances_do_not_depend_on_edit_history(initial_balance: Balance):
+    rng = random.Random(5)
+    end_date = datetime.date(2022, 12, 31)
+    dates = [initial_balance.date + datetime.timedelta(days=rng.randrange(365)) for _ in range(200)]
+    kept = [Event(description=str(idx), date=d, balance_impact=rng.uniform(-500, 500)) for idx, d in enumerate(dates)]
+    removed = [Event(description="tmp", date=e.date, balance_impact=rng.uniform(-1e6, 1e6)) for e in kept[:100]]
+    edited = IncrementalBalanceCalculator(initial_balance, end_date, removed + kept)
+    for event in removed:
+        edited.remove_event(event)
+    fresh = IncrementalBalanceCalculator(initial_balance, end_date, reversed(kept))
+
+    for day in range(0, 365, 7):
+        date = initial_balance.date + datetime.timedelta(days=day)
+        assert edited.balance_at(date) == fresh.balance_at(date)
+        assert edited.balance_at(date) == pytest.approx(BalanceIndex(edited.get_balance_log()).balance_at(date))
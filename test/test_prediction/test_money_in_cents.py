@@ -0,0 +1,144 @@
+import pytest
+import datetime
+import os
+from pathlib import Path
+
+import numpy as np
+
+from prediction import (
+    EventGenerator,
+    DataSourcesConfiguration,
+    EventsDataPaths,
+    ScenarioConfiguration,
+    BalanceLogCalulator,
+    VectorizedBalanceLogCalculator,
+    Balance,
+    Event,
+    read_event_columns,
+    to_cents,
+    format_cents,
+    line_to_event_in_cents,
+    MainCfg,
+    show_balance,
+    get_balance_logs,
+)
+from prediction.repo import CsvBalanceRepo
+from prediction.types import BalanceHistory, HistoryId
+
+
+@pytest.mark.parametrize("text, cents", (("12.34", 1234), ("5", 500), (" 0.1 ", 10), ("-7.5", -750)))
+def test_to_cents(text: str, cents: int):
+    assert to_cents(text) == cents
+
+
+@pytest.mark.parametrize("text", ("0.001", "abc"))
+def test_to_cents_raise(text: str):
+    with pytest.raises(ValueError):
+        to_cents(text)
+
+
+@pytest.mark.parametrize("cents, text", ((123456, "1_234.56"), (-5, "-0.05"), (0, "0.00")))
+def test_format_cents(cents: int, text: str):
+    assert format_cents(cents) == text
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+def test_generator_in_cents(example_data_folder_path: str, columnar: bool):
+    data_config = DataSourcesConfiguration(
+        monthly_spending_paths=EventsDataPaths((os.path.join(example_data_folder_path, "infinite_event.csv"),)),
+        one_time_spending_paths=EventsDataPaths([]),
+        monthly_income_paths=EventsDataPaths([]),
+        one_time_income_paths=EventsDataPaths((os.path.join(example_data_folder_path, "one_time_event.csv"),)),
+    )
+    scenario_config = ScenarioConfiguration(start_date=datetime.date(1999, 8, 1), end_date=datetime.date(2003, 1, 1))
+
+    in_units = EventGenerator(data_config, columnar=columnar).get_events(scenario_config)
+    in_cents = EventGenerator(data_config, columnar=columnar, cents=True).get_events(scenario_config)
+
+    assert [e.balance_impact for e in in_cents] == [round(e.balance_impact * 100) for e in in_units]
+    assert all(isinstance(e.balance_impact, int) for e in in_cents)
+
+
+def test_columns_in_cents_are_integers(tmp_path: Path):
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; date\nA; 0.1; 2022.02.03\nB; 19.99; 2022.02.04\n")
+
+    columns = read_event_columns(str(file_path), cents=True)
+
+    assert columns.value.dtype == np.int64
+    assert columns.value.tolist() == [10, 1999]
+
+
+def test_cents_accumulate_exactly():
+    events = [Event(description=str(d), date=datetime.date(2022, 1, d), balance_impact=10) for d in range(1, 11)]
+    initial_balance = Balance(description="I", date=datetime.date(2022, 1, 1), value=0)
+
+    balance_log = BalanceLogCalulator(events).get_balance_log(initial_balance)
+    balance_series = VectorizedBalanceLogCalculator.from_events(events).get_balance_log(initial_balance)
+
+    assert balance_log[-1].value == 100
+    assert balance_series.values.dtype == np.int64
+    assert balance_series == balance_log
+
+
+def test_repo_reads_back_integer_and_float_values(tmp_path: Path):
+    repo = CsvBalanceRepo(tmp_path / "repo")
+    history = BalanceHistory(
+        HistoryId("mixed"),
+        [
+            Balance("cents", datetime.datetime(2022, 1, 1), 1234),
+            Balance("units", datetime.datetime(2022, 1, 2), 12.5),
+        ],
+    )
+    repo.store_new_history(history)
+
+    loaded = repo.load_history(HistoryId("mixed"))
+
+    assert loaded == history
+    assert isinstance(loaded.balances[0].value, int)
+
+
+def test_float_start_balance_in_cents_mode_raise():
+    with pytest.raises(ValueError):
+        MainCfg(start_balance=12.5, end_date=datetime.date(2022, 1, 1), cents=True)
+    with pytest.raises(ValueError):
+        format_cents(12.5)
+
+
+@pytest.mark.parametrize("config_cents", (False, True))
+def test_cents_mismatch_between_config_and_generator_raise(example_data_folder_path: str, config_cents: bool):
+    data_config = DataSourcesConfiguration(
+        monthly_spending_paths=EventsDataPaths(()),
+        one_time_spending_paths=EventsDataPaths((os.path.join(example_data_folder_path, "one_time_event.csv"),)),
+        monthly_income_paths=EventsDataPaths(()),
+        one_time_income_paths=EventsDataPaths(()),
+    )
+    config = MainCfg(
+        start_balance=100, start_date=datetime.date(2022, 1, 1), end_date=datetime.date(2022, 2, 1), cents=config_cents
+    )
+    event_gen = EventGenerator(data_config, cents=not config_cents)
+
+    assert event_gen.cents is not config_cents
+    with pytest.raises(ValueError):
+        show_balance(config, event_gen)
+    with pytest.raises(ValueError):
+        get_balance_logs([config], event_gen)
+
+
+def test_columns_in_cents_match_row_parser(tmp_path: Path):
+    lines = ["A; 1000000000000000.01; 2022.02.03", "B; -0.05; 2022.02.04", "C; 7.50; 2022.02.05", "D; 1e3; 2022.02.06"]
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; date\n" + "\n".join(lines) + "\n")
+
+    columns = read_event_columns(str(file_path), cents=True)
+
+    assert columns.value.tolist() == [line_to_event_in_cents(line).value for line in lines]
+    assert columns.value.tolist() == [100_000_000_000_000_001, -5, 750, 100_000]
+
+
+def test_columns_with_fractions_of_cent_raise(tmp_path: Path):
+    file_path = tmp_path / "events.csv"
+    file_path.write_text("description; value; date\nA; 0.001; 2022.02.03\n")
+
+    with pytest.raises(ValueError):
+        read_event_columns(str(file_path), cents=True)
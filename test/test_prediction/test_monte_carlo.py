@@ -0,0 +1,79 @@
+import pytest
+
+import numpy as np
+
+from prediction import (
+    MonteCarloForecast,
+    Perturbation,
+    EventGenerator,
+    BalanceLogCalulator,
+    BalanceIndex,
+    Balance,
+    DataSourcesConfiguration,
+    EventsDataPaths,
+    ScenarioConfiguration,
+)
+
+
+def test_unperturbed_samples_match_balance_log(
+    data_config: DataSourcesConfiguration, scenario_config: ScenarioConfiguration
+):
+    forecast = MonteCarloForecast(data_config, Perturbation())
+
+    balances = forecast.sample_daily_balances(scenario_config, start_balance=100, n_samples=3, seed=1)
+
+    events = EventGenerator(data_config).get_events(scenario_config)
+    balance_log = BalanceLogCalulator(events).get_balance_log(Balance("Initial", scenario_config.start_date, 100))
+    n_days = (scenario_config.end_date - scenario_config.start_date).days + 1
+    days = np.arange(np.datetime64(scenario_config.start_date), n_days)
+    expected = BalanceIndex(balance_log).balances_at(days)
+    assert balances.shape == (3, n_days)
+    for sample in balances:
+        np.testing.assert_allclose(sample, expected)
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_results_depend_only_on_seed(
+    data_config: DataSourcesConfiguration, scenario_config: ScenarioConfiguration, max_workers: int
+):
+    forecast = MonteCarloForecast(data_config, Perturbation(3, 0.2, 0.5))
+
+    reference = forecast.simulate(scenario_config, 0, n_samples=50, seed=7, batch_size=16)
+    bands = forecast.simulate(scenario_config, 0, n_samples=50, seed=7, batch_size=16, max_workers=max_workers)
+
+    np.testing.assert_array_equal(bands.bands, reference.bands)
+    np.testing.assert_array_equal(bands.overdraft_probability, reference.overdraft_probability)
+
+
+def test_bands_are_ordered_and_probabilities_bounded(
+    data_config: DataSourcesConfiguration, scenario_config: ScenarioConfiguration
+):
+    forecast = MonteCarloForecast(data_config, Perturbation(5, 0.5, 0.5))
+
+    bands = forecast.simulate(scenario_config, 0, n_samples=200, seed=3)
+
+    assert len(bands.dates) == bands.bands.shape[1] == len(bands.overdraft_probability)
+    assert np.all(np.diff(bands.bands, axis=0) >= 0)
+    assert np.all((0 <= bands.overdraft_probability) & (bands.overdraft_probability <= 1))
+    assert bands.band(50.0).shape == bands.dates.shape
+
+
+def test_one_time_event_probability(tmp_path, scenario_config: ScenarioConfiguration):
+    file_path = tmp_path / "one_time.csv"
+    file_path.write_text("description; value; date\nBonus; 10; 2000.01.02\n")
+    no_paths = EventsDataPaths(())
+    data_config = DataSourcesConfiguration(no_paths, no_paths, no_paths, EventsDataPaths((str(file_path),)))
+    forecast = MonteCarloForecast(data_config, Perturbation(one_time_probability=0.3))
+
+    balances = forecast.sample_daily_balances(scenario_config, 0, n_samples=2000, seed=11)
+
+    assert set(np.unique(balances[:, -1])) <= {0.0, 10.0}
+    assert np.mean(balances[:, -1] == 10) == pytest.approx(0.3, abs=0.05)
+
+
+@pytest.mark.parametrize(
+    "kwargs", ({"max_income_delay": -1}, {"spending_variation": 1.5}, {"one_time_probability": -0.1})
+)
+def test_invalid_perturbation_raise(kwargs):
+    with pytest.raises(ValueError):
+        Perturbation(**kwargs)
@@ -0,0 +1,35 @@
+import pytest
+
+from prediction import EventGenerator, DataSourcesConfiguration, EventsDataPaths, ScenarioConfiguration, errors
+
+
+@pytest.mark.parametrize("columnar", (False, True))
+@pytest.mark.parametrize("use_processes", (False, True))
+def test_concurrent_matches_serial(
+    data_config: DataSourcesConfiguration, scenario_config: ScenarioConfiguration, columnar: bool, use_processes: bool
+):
+    serial = EventGenerator(config=data_config, columnar=columnar)
+    concurrent = EventGenerator(config=data_config, columnar=columnar, max_workers=3, use_processes=use_processes)
+
+    assert concurrent.get_events(scenario_config) == serial.get_events(scenario_config)
+    assert concurrent.get_paid_events() == serial.get_paid_events()
+    assert concurrent.get_skipped_events() == serial.get_skipped_events()
+
+
+def test_concurrent_validation_error_is_raised(tmp_path, scenario_config: ScenarioConfiguration):
+    file_path = tmp_path / "one_time.csv"
+    file_path.write_text("description; value; date\nA; -10; 2022.02.03\n")
+    data_config = DataSourcesConfiguration(
+        monthly_spending_paths=EventsDataPaths([]),
+        one_time_spending_paths=EventsDataPaths((str(file_path),)),
+        monthly_income_paths=EventsDataPaths([]),
+        one_time_income_paths=EventsDataPaths([]),
+    )
+
+    with pytest.raises(errors.ValidationError):
+        EventGenerator(config=data_config, max_workers=2).get_events(scenario_config)
+
+
+def test_not_positive_max_workers_raise(data_config: DataSourcesConfiguration):
+    with pytest.raises(ValueError):
+        EventGenerator(config=data_config, max_workers=0)
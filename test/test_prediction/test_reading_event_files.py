@@ -1,5 +1,7 @@
+import pytest
 import datetime
 import os
+from typing import Iterator
 
 from prediction import (
     EventData,
@@ -45,3 +47,25 @@ def assert_monthly_event(event: MonthlyEventData) -> None:
         assert isinstance(event.end_date, datetime.date)
         assert event.start_date <= event.end_date
         assert event.end_date.day == event.start_date.day
+
+
+def test_iter_yields_same_events_as_read(example_data_folder_path: str):
+    file_path = os.path.join(example_data_folder_path, "first_of_the_month_event.csv")
+    reader = EventsFileReader[MonthlyEventData](path=file_path, transform_func=line_to_monthly_event)
+
+    events_iter = reader.iter()
+
+    assert isinstance(events_iter, Iterator)
+    assert list(events_iter) == reader.read()
+
+
+def test_iter_parses_lines_lazily(tmp_path):
+    file_path = tmp_path / "lazy.csv"
+    file_path.write_text("description; value; date\nfirst; 10; 2022.01.01\nbroken line\n")
+    reader = EventsFileReader[EventData](path=str(file_path), transform_func=line_to_event)
+
+    events_iter = reader.iter()
+
+    assert next(events_iter).description == "first"
+    with pytest.raises(IndexError):
+        next(events_iter)
@@ -0,0 +1,92 @@
+import pytest
+import datetime
+import itertools
+from typing import List, Optional
+
+import numpy as np
+
+from prediction import MonthlyEventData, get_occurrence_range, get_occurrence_dates, get_occurrence_array
+from prediction._helpers import increase_date_by_one_month
+
+
+def repeat_by_stepping(
+    monthly_event: MonthlyEventData, start_date: datetime.date, end_date: datetime.date
+) -> List[datetime.date]:
+    date = monthly_event.start_date
+    if monthly_event.end_date is not None:
+        end_date = min(end_date, monthly_event.end_date)
+    result = []
+    while date <= end_date:
+        if date >= start_date:
+            result.append(date)
+        date = increase_date_by_one_month(date)
+    return result
+
+
+def monthly_event(start_date: datetime.date, end_date: Optional[datetime.date] = None) -> MonthlyEventData:
+    return MonthlyEventData(
+        description="rent", value=100, start_date=start_date, end_date=end_date, month_day=start_date.day
+    )
+
+
+_EVENTS = (
+    monthly_event(datetime.date(2002, 7, 1)),
+    monthly_event(datetime.date(2022, 5, 15), datetime.date(2022, 12, 15)),
+    monthly_event(datetime.date(2023, 1, 28), datetime.date(2023, 1, 28)),
+)
+_WINDOWS = (
+    (datetime.date(1999, 1, 3), datetime.date(1999, 1, 5)),
+    (datetime.date(2022, 5, 15), datetime.date(2022, 5, 15)),
+    (datetime.date(2022, 5, 16), datetime.date(2023, 2, 14)),
+    (datetime.date(2022, 1, 1), datetime.date(2024, 1, 1)),
+    (datetime.date(2023, 1, 29), datetime.date(2023, 12, 31)),
+)
+
+
+@pytest.mark.parametrize("event, window", tuple(itertools.product(_EVENTS, _WINDOWS)))
+def test_occurrences_match_month_stepping(event: MonthlyEventData, window):
+    expected = repeat_by_stepping(event, *window)
+
+    dates = get_occurrence_dates(event, *window)
+    array = get_occurrence_array(event, *window)
+
+    assert dates == expected
+    assert array.dtype == np.dtype("datetime64[D]")
+    assert array.tolist() == expected
+
+
+def test_old_event_range_starts_in_window():
+    event = monthly_event(datetime.date(1900, 3, 10))
+
+    first, count = get_occurrence_range(event, datetime.date(2023, 3, 11), datetime.date(2023, 6, 10))
+
+    assert first == 2023 * 12 + 3
+    assert count == 3
+
+
+def test_window_before_event_is_empty():
+    event = monthly_event(datetime.date(2023, 3, 10))
+
+    first, count = get_occurrence_range(event, datetime.date(2020, 1, 1), datetime.date(2021, 1, 1))
+
+    assert count == 0
+    assert get_occurrence_dates(event, datetime.date(2020, 1, 1), datetime.date(2021, 1, 1)) == []
+
+
+@pytest.mark.parametrize(
+    "window, valid",
+    (
+        ((datetime.date(2023, 1, 1), datetime.date(2023, 1, 31)), True),
+        ((datetime.date(2023, 1, 1), datetime.date(2023, 3, 31)), False),
+    ),
+)
+def test_month_day_missing_in_a_month_raise_in_both_paths(window, valid: bool):
+    event = monthly_event(datetime.date(2023, 1, 31))
+
+    if valid:
+        assert get_occurrence_array(event, *window).tolist() == get_occurrence_dates(event, *window)
+    else:
+        with pytest.raises(ValueError):
+            get_occurrence_dates(event, *window)
+        with pytest.raises(ValueError):
+            get_occurrence_array(event, *window)
@@ -0,0 +1,111 @@
+import pytest
+import datetime
+import random
+from typing import List
+
+import numpy as np
+
+from prediction import BalanceLogCalulator, VectorizedBalanceLogCalculator, Balance, Event, errors
+
+
+def random_events(seed: int, n_events: int) -> List[Event]:
+    rng = random.Random(seed)
+    origin = datetime.date(2022, 1, 1)
+    events = [
+        Event(
+            description=f"E{idx}",
+            date=origin + datetime.timedelta(days=rng.randrange(60)),
+            balance_impact=rng.uniform(-1_000, 1_000),
+        )
+        for idx in range(n_events)
+    ]
+    events.sort(key=lambda e: e.date)
+    return events
+
+
+def test_matches_event_by_event_calculator():
+    events = random_events(seed=3, n_events=500)
+    initial_balance = Balance(description="Initial", date=datetime.date(2022, 1, 20), value=1_234.5)
+    expected = BalanceLogCalulator(events).get_balance_log(initial_balance)
+
+    balance_log = VectorizedBalanceLogCalculator.from_events(events).get_balance_log(initial_balance)
+
+    assert len(balance_log) == len(expected)
+    assert balance_log.to_balances() == expected
+
+
+def test_whenEventsSameDate_thenReduceBalanceCount():
+    events = [
+        Event(description="A", date=datetime.date(2023, 4, 10), balance_impact=-1),
+        Event(description="B", date=datetime.date(2023, 4, 10), balance_impact=-2),
+        Event(description="C", date=datetime.date(2023, 4, 12), balance_impact=10),
+    ]
+    initial_balance = Balance(description="I", date=datetime.date(2023, 4, 10), value=5)
+
+    balance_log = VectorizedBalanceLogCalculator.from_events(events).get_balance_log(initial_balance)
+
+    assert balance_log[0] == Balance(description="I, A, B", date=datetime.date(2023, 4, 10), value=2)
+    assert balance_log[-1] == Balance(description="C", date=datetime.date(2023, 4, 12), value=12)
+    assert len(balance_log) == 2
+
+
+def test_initial_balance_when_no_events():
+    initial_balance = Balance(description="Initial balance", date=datetime.date(2022, 4, 11), value=1002)
+
+    balance_log = VectorizedBalanceLogCalculator.from_events([]).get_balance_log(initial_balance)
+
+    assert balance_log == [initial_balance]
+
+
+def test_from_arrays_without_descriptions():
+    dates = np.array(["2022-01-05", "2022-01-01", "2022-01-05"], dtype="datetime64[D]")
+    impacts = np.array([10.0, 7.0, -3.0])
+    initial_balance = Balance(description="Initial", date=datetime.date(2022, 1, 2), value=100)
+
+    balance_log = VectorizedBalanceLogCalculator(dates, impacts).get_balance_log(initial_balance)
+
+    assert balance_log.dates.tolist() == [datetime.date(2022, 1, 2), datetime.date(2022, 1, 5)]
+    assert balance_log.values.tolist() == [100, 107]
+    assert balance_log[1].description == ""
+
+
+def test_daily_balances_match_balance_log():
+    events = random_events(seed=5, n_events=300)
+    initial_balance = Balance(description="Initial", date=datetime.date(2022, 1, 20), value=100.0)
+    end_date = datetime.date(2022, 2, 20)
+    calculator = VectorizedBalanceLogCalculator.from_events(events)
+
+    daily_balances = calculator.get_daily_balances(initial_balance, end_date)
+
+    balance_log = calculator.get_balance_log(initial_balance)
+    expected = [
+        next(b.value for b in reversed(balance_log) if b.date <= initial_balance.date + datetime.timedelta(days=i))
+        for i in range(32)
+    ]
+    assert daily_balances.tolist() == expected
+
+
+def test_save_daily_balances_to_memory_mapped_file(tmp_path):
+    events = [
+        Event(description="A", date=datetime.date(2023, 4, 11), balance_impact=-1),
+        Event(description="B", date=datetime.date(2023, 4, 13), balance_impact=10),
+        Event(description="C", date=datetime.date(2023, 4, 20), balance_impact=10),
+    ]
+    initial_balance = Balance(description="I", date=datetime.date(2023, 4, 10), value=5)
+    path = str(tmp_path / "daily.npy")
+
+    VectorizedBalanceLogCalculator.from_events(events).save_daily_balances(
+        path, initial_balance, datetime.date(2023, 4, 14)
+    )
+
+    daily_balances = np.load(path, mmap_mode="r")
+    assert isinstance(daily_balances, np.memmap)
+    assert daily_balances.dtype == np.int64
+    assert daily_balances.tolist() == [5, 4, 4, 14, 14]
+
+
+def test_daily_balances_end_before_start_raise():
+    initial_balance = Balance(description="I", date=datetime.date(2023, 4, 10), value=5)
+
+    with pytest.raises(errors.CalculatorError):
+        VectorizedBalanceLogCalculator.from_events([]).get_daily_balances(initial_balance, datetime.date(2023, 4, 9))
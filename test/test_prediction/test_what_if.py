@@ -0,0 +1,71 @@
+import pytest
+import datetime
+
+import numpy as np
+
+from prediction import WhatIfSweep, Event, Balance, BalanceLogCalulator, BalanceIndex, ScenarioConfiguration
+
+
+@pytest.fixture
+def scenario_config() -> ScenarioConfiguration:
+    return ScenarioConfiguration(start_date=datetime.date(2022, 1, 1), end_date=datetime.date(2022, 3, 31))
+
+
+@pytest.fixture
+def events() -> list:
+    return [
+        Event("salary", datetime.date(2022, 1, 10), 3000),
+        Event("rent", datetime.date(2022, 1, 15), -1200),
+        Event("food", datetime.date(2022, 1, 15), -400),
+        Event("salary", datetime.date(2022, 2, 10), 3000),
+        Event("rent", datetime.date(2022, 2, 15), -1200),
+        Event("salary", datetime.date(2022, 3, 10), 3000),
+        Event("rent", datetime.date(2022, 3, 15), -1200),
+        Event("late", datetime.date(2022, 4, 15), -1),
+    ]
+
+
+def expected_daily_balances(events: list, config: ScenarioConfiguration, start_balance: float) -> np.ndarray:
+    balance_log = BalanceLogCalulator(events).get_balance_log(Balance("Initial", config.start_date, start_balance))
+    dates = np.arange(np.datetime64(config.start_date), np.datetime64(config.end_date) + 1)
+    return BalanceIndex(balance_log).balances_at(dates)
+
+
+def test_grid_matches_rerun_with_scaled_events(events: list, scenario_config: ScenarioConfiguration):
+    sweep = WhatIfSweep(events, scenario_config, start_balance=1000)
+    offsets = [0, -500, 250]
+    scales = np.array([sweep.scale_vector({}), sweep.scale_vector({"rent": 1.1}), sweep.scale_vector({"food": 0})])
+
+    result = sweep.evaluate(offsets, scales)
+
+    assert sweep.categories == ("food", "rent", "salary")
+    assert result.shape == (3, 3, len(sweep.dates))
+    for i, offset in enumerate(offsets):
+        for j, scale in enumerate(scales):
+            factors = dict(zip(sweep.categories, scale))
+            scaled = [Event(e.description, e.date, e.balance_impact * factors.get(e.description, 1)) for e in events]
+            np.testing.assert_allclose(
+                result[i, j], expected_daily_balances(scaled, scenario_config, 1000 + offset)
+            )
+
+
+def test_min_balances(events: list, scenario_config: ScenarioConfiguration):
+    sweep = WhatIfSweep(events, scenario_config, start_balance=0)
+    scales = np.array([[1, 1, 1], [1, 2, 1]])
+
+    np.testing.assert_allclose(sweep.min_balances([0, 100], scales), sweep.evaluate([0, 100], scales).min(axis=2))
+
+
+def test_categories_can_be_grouped(events: list, scenario_config: ScenarioConfiguration):
+    sweep = WhatIfSweep(events, scenario_config, 0, category_of=lambda d: "income" if d == "salary" else "costs")
+
+    assert sweep.categories == ("costs", "income")
+
+
+def test_invalid_grid_raise(events: list, scenario_config: ScenarioConfiguration):
+    sweep = WhatIfSweep(events, scenario_config, 0)
+
+    with pytest.raises(ValueError):
+        sweep.evaluate([0], np.ones((1, 2)))
+    with pytest.raises(ValueError):
+        sweep.scale_vector({"unknown": 2})